@@ -15,9 +15,12 @@ are called from within the get_activity_coefficient method of the Solution class
 
 '''
 import math
+import numpy as np
+from functools import lru_cache
 
 # functions for properties of water
 import pyEQL.water_properties as h2o
+from pyEQL.jit import njit, prange
 
 # the pint unit registry
 from pyEQL import unit
@@ -26,20 +29,36 @@ from pyEQL import unit
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
+pyEQL.logging_system.configure_logger(logger)
 
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
+# upper limits of ionic strength (mol/kg) over which the Debye-Huckel limiting
+# law, Guntelberg approximation, and Davies equation are valid
+DEBYEHUCKEL_LIMIT = 0.005
+GUNTELBERG_LIMIT = 0.1
+DAVIES_LIMIT = 0.5
 
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
+# temperature-independent part of the Debye-Huckel limiting slope A^{\gamma},
+# expressed for a water density in kg/m3 and a temperature in K. See
+# _debye_parameter_activity()
+_DEBYE_ACTIVITY_PREFACTOR = (unit.elementary_charge ** 3 * ( 2 * math.pi * unit.avogadro_number * unit('kg/m**3')) ** 0.5 \
+    / ( 4 * math.pi * unit.epsilon_0 * unit.boltzmann_constant * unit('K')) ** 1.5).to('kg ** 0.5 / mol ** 0.5').magnitude
 
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+# The Debye parameters depend only on temperature, and are requested once for
+# every solute whose activity coefficient is calculated. Memoize their
+# magnitudes as floats; the functions below build a new Quantity on each call,
+# so that callers can't modify the memoized value.
+@lru_cache(maxsize=32)
+def _debye_parameter_B_cached(temperature):
+    '''
+    Return the magnitude of _debye_parameter_B(temperature) in
+    m ** 2 / kg ** 0.5 / mol ** 0.5 as a float.
+    '''
+    # TODO - fix this and resolve units
+    T = unit(temperature)
+    param_B = ( 8 * math.pi * unit.avogadro_number * unit.elementary_charge ** 2 
+    / (h2o.water_density(T) * unit.epsilon_0 * h2o.water_dielectric_constant(T) * unit.boltzmann_constant * T) )** 0.5
+    return param_B.to('m ** 2 / kg ** 0.5 / mol ** 0.5').magnitude
 
 def _debye_parameter_B(temperature='25 degC'):
     '''
@@ -64,11 +83,61 @@ def _debye_parameter_B(temperature='25 degC'):
     0.3291...
     
     '''
-    # TODO - fix this and resolve units
-    param_B = ( 8 * math.pi * unit.avogadro_number * unit.elementary_charge ** 2 
-    / (h2o.water_density(unit(temperature)) * unit.epsilon_0 * h2o.water_dielectric_constant(unit(temperature)) * unit.boltzmann_constant * unit(temperature)) )** 0.5
-    return param_B.to_base_units()
+    return unit.Quantity(_debye_parameter_B_cached(temperature),'m ** 2 / kg ** 0.5 / mol ** 0.5')
+    
+def _debye_parameter_activity_magnitude(T_K,rho,epsilon):
+    '''
+    Return the magnitude of the Debye-Huckel parameter A (base e) in kg ** 0.5 / mol ** 0.5,
+    given the temperature in K, the density of water in kg/m3, and the dielectric
+    constant of water. The arguments may be floats or arrays of the same shape.
+    See _debye_parameter_activity()
+    '''
+    eps_T = epsilon * T_K
+    return _DEBYE_ACTIVITY_PREFACTOR * np.sqrt(rho) / (eps_T * np.sqrt(eps_T))
+
+def _debye_parameter_activity_array(temperature):
+    '''
+    Return the Debye-Huckel parameter A (base e) at each temperature in an array.
+    
+    This is the vectorized counterpart of _debye_parameter_activity(), for use in
+    temperature sweeps. It is not memoized.
+    
+    Parameters
+    ----------
+    temperature : Quantity
+                  An array of temperatures
+    
+    Returns
+    -------
+    Quantity          The parameter A at each temperature, kg ** 0.5 / mol ** 0.5
+    
+    See Also
+    --------
+    _debye_parameter_activity
+    
+    '''
+    T_K = temperature.to('K').magnitude
+    rho = h2o.water_density(temperature).magnitude
+    epsilon = h2o.water_dielectric_constant(temperature)
+    
+    return _debye_parameter_activity_magnitude(T_K,rho,epsilon) * unit('kg ** 0.5 / mol ** 0.5')
+
+@lru_cache(maxsize=32)
+def _debye_parameter_activity_cached(temperature):
+    '''
+    Return the magnitude of _debye_parameter_activity(temperature) in
+    kg ** 0.5 / mol ** 0.5 as a float.
+    '''
+    # parse the temperature and look up the water properties only once
+    T = unit(temperature)
+    rho = h2o.water_density(T).magnitude
+    epsilon = h2o.water_dielectric_constant(T)
     
+    debyeparam = float(_debye_parameter_activity_magnitude(T.to('K').magnitude,rho,epsilon))
+    
+    logger.info('Computed Debye-Huckel Limiting Law Constant A^{\\gamma} = %s at %s', unit.Quantity(debyeparam,'kg ** 0.5 / mol ** 0.5'),temperature)
+    return debyeparam
+
 def _debye_parameter_activity(temperature='25 degC'):
     '''
     Return the constant A for use in the Debye-Huckel limiting law (base 10)
@@ -110,12 +179,17 @@ def _debye_parameter_activity(temperature='25 degC'):
     _debye_parameter_osmotic
     
     '''
-    
-    debyeparam = unit.elementary_charge ** 3 * ( 2 * math.pi * unit.avogadro_number * h2o.water_density(unit(temperature))) ** 0.5 \
-    / ( 4 * math.pi * unit.epsilon_0 * h2o.water_dielectric_constant(unit(temperature)) * unit.boltzmann_constant * unit(temperature)) ** 1.5
-    
-    logger.info('Computed Debye-Huckel Limiting Law Constant A^{\\gamma} = %s at %s' % (debyeparam,temperature))
-    return debyeparam.to('kg ** 0.5 / mol ** 0.5')
+    return unit.Quantity(_debye_parameter_activity_cached(temperature),'kg ** 0.5 / mol ** 0.5')
+
+@lru_cache(maxsize=32)
+def _debye_parameter_osmotic_cached(temperature):
+    '''
+    Return the magnitude of _debye_parameter_osmotic(temperature) in
+    kg ** 0.5 / mol ** 0.5 as a float.
+    '''
+    output = 1/3 * _debye_parameter_activity_cached(temperature)
+    logger.info('Computed Debye-Huckel Limiting slope for osmotic coefficient A^{\\phi} = %s at %s', unit.Quantity(output,'kg ** 0.5 / mol ** 0.5'),temperature)
+    return output
 
 def _debye_parameter_osmotic(temperature='25 degC'):
     '''
@@ -152,10 +226,28 @@ def _debye_parameter_osmotic(temperature='25 degC'):
     _debye_parameter_activity
     
     '''
+    return unit.Quantity(_debye_parameter_osmotic_cached(temperature),'kg ** 0.5 / mol ** 0.5')
+
+@lru_cache(maxsize=32)
+def _debye_parameter_volume_cached(temperature):
+    '''
+    Return the magnitude of _debye_parameter_volume(temperature) in
+    cm ** 3 * kg ** 0.5 / mol ** 1.5 as a float.
+    '''
+    # TODO - add partial derivatives to calculation
+    T = unit(temperature)
+    epsilon = h2o.water_dielectric_constant(T)
+    dedp = unit('-0.01275 1/MPa')
+    result = -2 * _debye_parameter_osmotic(temperature) * unit.R * T * \
+    (3 / epsilon * dedp - 1/unit('2.2 GPa'))
+    #result = unit('1.898 cm ** 3 * kg ** 0.5 /  mol ** 1.5')
     
-    output = 1/3 * _debye_parameter_activity(temperature)
-    logger.info('Computed Debye-Huckel Limiting slope for osmotic coefficient A^{\\phi} = %s at %s' % (output,temperature))
-    return output.to('kg ** 0.5 /mol ** 0.5')
+    if T != unit('25 degC'):
+        logger.warning('Debye-Huckel limiting slope for volume is approximate when T is not equal to 25 degC')
+    
+    logger.info('Computed Debye-Huckel Limiting Slope for volume A^V = %s at %s', result,temperature)
+    
+    return result.to('cm ** 3 * kg ** 0.5 /  mol ** 1.5').magnitude
 
 def _debye_parameter_volume(temperature='25 degC'):
     '''
@@ -203,20 +295,7 @@ def _debye_parameter_volume(temperature='25 degC'):
     _debye_parameter_osmotic
     
     '''
-    
-    # TODO - add partial derivatives to calculation
-    epsilon = h2o.water_dielectric_constant(unit(temperature))
-    dedp = unit('-0.01275 1/MPa')
-    result = -2 * _debye_parameter_osmotic(temperature) * unit.R * unit(temperature) * \
-    (3 / epsilon * dedp - 1/unit('2.2 GPa'))
-    #result = unit('1.898 cm ** 3 * kg ** 0.5 /  mol ** 1.5')
-    
-    if unit(temperature) != unit('25 degC'):
-        logger.warning('Debye-Huckel limiting slope for volume is approximate when T is not equal to 25 degC')
-    
-    logger.info('Computed Debye-Huckel Limiting Slope for volume A^V = %s at %s' % (result,temperature))
-    
-    return result.to('cm ** 3 * kg ** 0.5 /  mol ** 1.5')
+    return unit.Quantity(_debye_parameter_volume_cached(temperature),'cm ** 3 * kg ** 0.5 / mol ** 1.5')
 
 def get_activity_coefficient_debyehuckel(ionic_strength,formal_charge=1,temperature='25 degC'):
     '''
@@ -224,10 +303,11 @@ def get_activity_coefficient_debyehuckel(ionic_strength,formal_charge=1,temperat
     
     Parameters
     ----------
-    formal_charge : int, optional      
+    formal_charge : int or array of int, optional      
                     The charge on the solute, including sign. Defaults to +1 if not specified.
     ionic_strength : Quantity
-                     The ionic strength of the parent solution, mol/kg
+                     The ionic strength of the parent solution, mol/kg. The magnitude
+                     may be an array.
     temperature : str Quantity, optional
                      String representing the temperature of the solution. Defaults to '25 degC' if not specified.
                   
@@ -235,6 +315,7 @@ def get_activity_coefficient_debyehuckel(ionic_strength,formal_charge=1,temperat
     -------
     Quantity
          The mean molal (mol/kg) scale ionic activity coefficient of solute, dimensionless.
+         If ionic_strength or formal_charge is an array, the magnitude is an array.
 
     See Also
     --------
@@ -254,13 +335,16 @@ def get_activity_coefficient_debyehuckel(ionic_strength,formal_charge=1,temperat
            pp 103. Wiley Interscience, 1996.
     
     '''
+    # work with magnitudes so that arrays of ionic strengths and/or charges
+    # can be evaluated in a single call
+    I = ionic_strength.to('mol/kg').magnitude
+    z = np.asarray(formal_charge)
+    
     # check if this method is valid for the given ionic strength
-    if not ionic_strength.magnitude <= 0.005:
+    if np.any(I > DEBYEHUCKEL_LIMIT):
         logger.warning('Ionic strength exceeds valid range of the Debye-Huckel limiting law')
     
-    log_f = - _debye_parameter_activity(temperature) * formal_charge ** 2 * ionic_strength ** 0.5
-
-    return math.exp(log_f) * unit('1 dimensionless')
+    return _debyehuckel_gamma(_debye_parameter_activity_cached(temperature),z,I) * unit('1 dimensionless')
 
 def get_activity_coefficient_guntelberg(ionic_strength,formal_charge=1,temperature='25 degC'):
     '''
@@ -268,10 +352,11 @@ def get_activity_coefficient_guntelberg(ionic_strength,formal_charge=1,temperatu
     
     Parameters
     ----------
-    formal_charge : int, optional      
+    formal_charge : int or array of int, optional      
                     The charge on the solute, including sign. Defaults to +1 if not specified.
     ionic_strength : Quantity
-                     The ionic strength of the parent solution, mol/kg
+                     The ionic strength of the parent solution, mol/kg. The magnitude
+                     may be an array.
     temperature : str Quantity, optional
                      String representing the temperature of the solution. Defaults to '25 degC' if not specified.
                   
@@ -279,6 +364,7 @@ def get_activity_coefficient_guntelberg(ionic_strength,formal_charge=1,temperatu
     -------
     Quantity
          The mean molal (mol/kg) scale ionic activity coefficient of solute, dimensionless.
+         If ionic_strength or formal_charge is an array, the magnitude is an array.
          
     See Also
     --------
@@ -298,13 +384,16 @@ def get_activity_coefficient_guntelberg(ionic_strength,formal_charge=1,temperatu
            pp 103. Wiley Interscience, 1996.
     
     '''
+    # work with magnitudes so that arrays of ionic strengths and/or charges
+    # can be evaluated in a single call
+    I = ionic_strength.to('mol/kg').magnitude
+    z = np.asarray(formal_charge)
+    
     # check if this method is valid for the given ionic strength
-    if not ionic_strength.magnitude <= 0.1:
+    if np.any(I > GUNTELBERG_LIMIT):
         logger.warning('Ionic strength exceeds valid range of the Guntelberg approximation')
     
-    log_f = - _debye_parameter_activity(temperature) * formal_charge ** 2 * ionic_strength ** 0.5 / (1+ionic_strength.magnitude ** 0.5)
-
-    return math.exp(log_f) * unit('1 dimensionless')
+    return _guntelberg_gamma(_debye_parameter_activity_cached(temperature),z,I) * unit('1 dimensionless')
     
 def get_activity_coefficient_davies(ionic_strength,formal_charge=1,temperature='25 degC'):
     '''
@@ -312,10 +401,11 @@ def get_activity_coefficient_davies(ionic_strength,formal_charge=1,temperature='
     
     Parameters
     ----------
-    formal_charge : int, optional      
+    formal_charge : int or array of int, optional      
                     The charge on the solute, including sign. Defaults to +1 if not specified.
     ionic_strength : Quantity
-                     The ionic strength of the parent solution, mol/kg
+                     The ionic strength of the parent solution, mol/kg. The magnitude
+                     may be an array.
     temperature : str Quantity, optional
                      String representing the temperature of the solution. Defaults to '25 degC' if not specified.
                   
@@ -323,6 +413,7 @@ def get_activity_coefficient_davies(ionic_strength,formal_charge=1,temperature='
     -------
     Quantity
          The mean molal (mol/kg) scale ionic activity coefficient of solute, dimensionless.
+         If ionic_strength or formal_charge is an array, the magnitude is an array.
 
     See Also
     --------
@@ -342,14 +433,77 @@ def get_activity_coefficient_davies(ionic_strength,formal_charge=1,temperature='
            pp 103. Wiley Interscience, 1996.
     
     '''
+    # the units in this empirical equation don't work out, so we must use magnitudes.
+    # This also allows arrays of ionic strengths and/or charges to be evaluated
+    # in a single call
+    I = ionic_strength.to('mol/kg').magnitude
+    z = np.asarray(formal_charge)
+    
     # check if this method is valid for the given ionic strength
-    if not ionic_strength.magnitude <= 0.5 and ionic_strength.magnitude >= 0.1:
+    if np.any(I > DAVIES_LIMIT):
         logger.warning('Ionic strength exceeds valid range of the Davies equation')
     
-    # the units in this empirical equation don't work out, so we must use magnitudes
-    log_f = - _debye_parameter_activity(temperature).magnitude * formal_charge ** 2 * (ionic_strength.magnitude ** 0.5 / (1+ionic_strength.magnitude ** 0.5) - 0.2 * ionic_strength.magnitude)
+    return _davies_gamma(_debye_parameter_activity_cached(temperature),z,I) * unit('1 dimensionless')
+
+# Numerical kernels for the Debye-Huckel family of equations. They take the
+# Debye-Huckel constant A (kg^0.5/mol^0.5), the formal charge z, and the ionic
+# strength I (mol/kg) as plain numbers or arrays, and are compiled with numba
+# when it is available
+
+@njit(cache=True)
+def _debyehuckel_gamma(A,z,I):
+    '''
+    Return the activity coefficient according to the Debye-Huckel limiting law
+    
+    See get_activity_coefficient_debyehuckel()
+    '''
+    return np.exp(- A * z ** 2 * np.sqrt(I))
+
+@njit(cache=True)
+def _guntelberg_gamma(A,z,I):
+    '''
+    Return the activity coefficient according to the Guntelberg approximation
+    
+    See get_activity_coefficient_guntelberg()
+    '''
+    sqrt_I = np.sqrt(I)
+    return np.exp(- A * z ** 2 * sqrt_I / (1 + sqrt_I))
+
+@njit(cache=True)
+def _davies_gamma(A,z,I):
+    '''
+    Return the activity coefficient according to the Davies equation
+    
+    See get_activity_coefficient_davies()
+    '''
+    sqrt_I = np.sqrt(I)
+    return np.exp(- A * z ** 2 * (sqrt_I / (1 + sqrt_I) - 0.2 * I))
+
+@njit(parallel=True,cache=True)
+def _debyehuckel_family_gamma(A,z,I):
+    '''
+    Return the activity coefficients of ions with the charges in array z at ionic
+    strength I, using whichever of the Debye-Huckel limiting law, Guntelberg
+    approximation, or Davies equation is valid at I.
+    
+    Unit activity coefficients are returned if I exceeds DAVIES_LIMIT. The ions are
+    independent of one another, so they are evaluated in parallel when numba is
+    available. See Solution.get_activities_array()
+    '''
+    gamma = np.ones(z.shape[0])
+    
+    if I > DAVIES_LIMIT:
+        return gamma
+    
+    for i in prange(z.shape[0]):
+        if I <= DEBYEHUCKEL_LIMIT:
+            gamma[i] = _debyehuckel_gamma(A,z[i],I)
+        elif I <= GUNTELBERG_LIMIT:
+            gamma[i] = _guntelberg_gamma(A,z[i],I)
+        else:
+            gamma[i] = _davies_gamma(A,z[i],I)
     
-    return math.exp(log_f) * unit('1 dimensionless')
+    return gamma
 
 def get_activity_coefficient_pitzer(ionic_strength,molality,alpha1,alpha2,beta0,beta1,beta2,C_phi,z_cation,z_anion,nu_cation,nu_anion,temperature='25 degC',b=1.2):
     '''
@@ -451,6 +605,64 @@ def get_activity_coefficient_pitzer(ionic_strength,molality,alpha1,alpha2,beta0,
     
     return math.exp(loggamma) * unit('1 dimensionless')
     
+def make_activity_coefficient_pitzer(alpha1,alpha2,beta0,beta1,beta2,C_phi,z_cation,z_anion,nu_cation,nu_anion,temperature='25 degC',b=1.2):
+    '''
+    Return a function that calculates the Pitzer activity coefficient of a single salt
+    
+    The Pitzer parameters of a salt are usually fixed while its activity coefficient is
+    evaluated at many ionic strengths. This factory does all of the work that depends
+    only on the parameters and temperature once, and returns a function of the ionic
+    strength and molality alone.
+    
+    Parameters
+    ----------
+    alpha1, alpha2, beta0, beta1, beta2, C_phi, z_cation, z_anion, nu_cation, nu_anion, temperature, b:
+                    See get_activity_coefficient_pitzer()
+    
+    Returns
+    -------
+    function
+        A function activity_coefficient(ionic_strength,molality) that takes the ionic
+        strength and molality as Quantities and returns the same result as
+        get_activity_coefficient_pitzer() called with the parameters above.
+    
+    Examples
+    --------
+    >>> activity_coefficient = make_activity_coefficient_pitzer(1,0.5,-.0181191983,-.4625822071,.4682,.000246063,1,-1,1,1,b=1.2)
+    >>> activity_coefficient(0.5*unit('mol/kg'),0.5*unit('mol/kg')) #doctest: +ELLIPSIS
+    <Quantity(0.61915..., 'dimensionless')>
+    
+    See Also
+    --------
+    get_activity_coefficient_pitzer
+    
+    '''
+    # precompute everything that does not depend on the ionic strength or molality.
+    # All of the parameters are in kg / mol based units
+    beta0, beta1, beta2, C_phi = float(beta0), float(beta1), float(beta2), float(C_phi)
+    nu_product = nu_cation * nu_anion
+    nu_sum = nu_cation + nu_anion
+    debye_term = -1 * abs(z_cation * z_anion) * _debye_parameter_osmotic_cached(temperature)
+    B_coeff = 2 * nu_product / nu_sum
+    C_coeff = 3 * nu_product ** 1.5 / nu_sum * C_phi
+    
+    def activity_coefficient(ionic_strength,molality):
+        I = ionic_strength.to('mol/kg').magnitude
+        m = molality.to('mol/kg').magnitude
+        
+        sqrt_I = math.sqrt(I)
+        b_sqrt_I = b * sqrt_I
+        
+        B_MX = beta0 + beta1 * _pitzer_f1(alpha1 * sqrt_I) + beta2 * _pitzer_f1(alpha2 * sqrt_I)
+        B_phi = beta0 + beta1 * math.exp(-alpha1 * sqrt_I) + beta2 * math.exp(-alpha2 * sqrt_I)
+        
+        loggamma = debye_term * (sqrt_I / (1 + b_sqrt_I) + 2/b * math.log1p(b_sqrt_I)) \
+        + B_coeff * m * (B_MX + B_phi) + C_coeff * m ** 2
+        
+        return math.exp(loggamma) * unit('1 dimensionless')
+    
+    return activity_coefficient
+
 def get_apparent_volume_pitzer(ionic_strength,molality,alpha1,alpha2,beta0,beta1,beta2,C_phi,V_o,z_cation,z_anion,nu_cation,nu_anion,temperature='25 degC',b=1.2):
     '''
     Return the apparent molar volume of solute in the parent solution according to the Pitzer model.
@@ -549,15 +761,20 @@ def get_apparent_volume_pitzer(ionic_strength,molality,alpha1,alpha2,beta0,beta1
     # assign units appropriate for the volume parameter
     BMX = _pitzer_B_MX(ionic_strength,alpha1,alpha2,beta0,beta1,beta2) * unit('kg /mol/dabar')
     
-    second_term = (nu_cation + nu_anion) * abs(z_cation * z_anion) * (_debye_parameter_volume(temperature) / 2 / b) * math.log((1+b*ionic_strength ** 0.5))
+    # charge and stoichiometry products used by more than one term
+    z_abs = abs(z_cation * z_anion)
+    nu_product = nu_cation * nu_anion
     
-    third_term = nu_cation * nu_anion * unit.R * unit(temperature) * \
-    (2 * molality * BMX + molality ** 2 * C_phi * (nu_cation * nu_anion) ** 0.5)
+    second_term = (nu_cation + nu_anion) * z_abs * (_debye_parameter_volume(temperature) / 2 / b) * math.log1p(b * ionic_strength ** 0.5)
+    
+    third_term = nu_product * unit.R * unit(temperature) * \
+    (2 * molality * BMX + molality ** 2 * C_phi * nu_product ** 0.5)
     
     volume = V_o + second_term + third_term
     
     return volume.to('cm ** 3 / mol')
     
+@njit(cache=True)
 def _pitzer_f1(x):
     '''
     The function of ionic strength used to calculate \beta_MX in the Pitzer ion intercation model.
@@ -576,10 +793,11 @@ def _pitzer_f1(x):
     '''
     # return 0 if the input is 0
     if x == 0:
-        return 0
+        return 0.0
     else:
         return 2 * ( 1 - (1+x) * math.exp(-x)) / x ** 2
 
+@njit(cache=True)
 def _pitzer_f2(x):
     '''
     The function of ionic strength used to calculate \beta_\gamma in the Pitzer ion intercation model.
@@ -598,7 +816,7 @@ def _pitzer_f2(x):
     '''
     # return 0 if the input is 0
     if x == 0:
-        return 0
+        return 0.0
     else:
         return -2 * ( 1 - (1 + x + x ** 2 / 2) * math.exp(-x)) / x ** 2
 
@@ -637,8 +855,10 @@ def _pitzer_B_MX(ionic_strength,alpha1,alpha2,beta0,beta1,beta2):
     _pitzer_f1
     
     '''
-    coeff = beta0 + beta1 * _pitzer_f1(alpha1 * ionic_strength ** 0.5) + beta2 * _pitzer_f1(alpha2 * ionic_strength ** 0.5)
-    return coeff.magnitude
+    # _pitzer_f1 is a compiled kernel and takes plain (dimensionless) floats
+    sqrt_I = ionic_strength ** 0.5
+    coeff = beta0 + beta1 * _pitzer_f1(float(alpha1 * sqrt_I)) + beta2 * _pitzer_f1(float(alpha2 * sqrt_I))
+    return float(coeff)
 
 #def _pitzer_B_gamma(ionic_strength,alpha1,alpha2,beta1,beta2):
 #    '''
@@ -717,7 +937,8 @@ def _pitzer_B_phi(ionic_strength,alpha1,alpha2,beta0,beta1,beta2):
     Journal of Chemical & Engineering Data, 55(2), 830–838. doi:10.1021/je900487a
     
     '''
-    coeff = beta0 + beta1 * math.exp(-alpha1 * ionic_strength ** 0.5) + beta2 * math.exp(-alpha2* ionic_strength ** 0.5)
+    sqrt_I = ionic_strength ** 0.5
+    coeff = beta0 + beta1 * math.exp(-alpha1 * sqrt_I) + beta2 * math.exp(-alpha2 * sqrt_I)
     return coeff
 
 #def _pitzer_C_MX(C_phi,z_cation,z_anion):
@@ -793,9 +1014,16 @@ def _pitzer_log_gamma(ionic_strength,molality,B_MX,B_phi,C_phi,z_cation,z_anion,
     A Generic and Updatable Pitzer Characterization of Aqueous Binary Electrolyte Solutions at 1 bar and 25 °C. 
     Journal of Chemical & Engineering Data, 56(12), 5066–5077. doi:10.1021/je2009329
     '''
-    first_term = -1 * abs(z_cation * z_anion) * _debye_parameter_osmotic(temperature) * (ionic_strength ** 0.5 / (1+ b*ionic_strength ** 0.5) + 2/b * math.log(1+b*ionic_strength**0.5))
-    second_term = 2 * molality * nu_cation * nu_anion / (nu_cation + nu_anion) * (B_MX + B_phi)
-    third_term = 3 * molality ** 2 * (nu_cation * nu_anion) ** 1.5 / (nu_cation + nu_anion) * C_phi
+    sqrt_I = ionic_strength ** 0.5
+    b_sqrt_I = b * sqrt_I
+    # charge and stoichiometry products used by more than one term
+    z_abs = abs(z_cation * z_anion)
+    nu_product = nu_cation * nu_anion
+    nu_sum = nu_cation + nu_anion
+    
+    first_term = -1 * z_abs * _debye_parameter_osmotic(temperature) * (sqrt_I / (1 + b_sqrt_I) + 2/b * math.log1p(b_sqrt_I))
+    second_term = 2 * molality * nu_product / nu_sum * (B_MX + B_phi)
+    third_term = 3 * molality ** 2 * nu_product ** 1.5 / nu_sum * C_phi
     
     ln_gamma = first_term + second_term + third_term
     
@@ -897,9 +1125,15 @@ def get_osmotic_coefficient_pitzer(ionic_strength,molality,alpha1,alpha2,beta0,b
     C_phi = C_phi * unit('kg ** 2 /mol ** 2')
     B_phi = _pitzer_B_phi(ionic_strength,alpha1,alpha2,beta0,beta1,beta2) * unit('kg/mol')
     
-    first_term = 1 - _debye_parameter_osmotic(temperature) * abs(z_cation * z_anion) * ionic_strength ** 0.5 / (1 + b * ionic_strength ** 0.5)
-    second_term = molality * 2 * nu_cation * nu_anion / (nu_cation + nu_anion) * B_phi
-    third_term = molality ** 2 * ( 2 * (nu_cation * nu_anion) ** 1.5 / (nu_cation + nu_anion)) * C_phi
+    sqrt_I = ionic_strength ** 0.5
+    # charge and stoichiometry products used by more than one term
+    z_abs = abs(z_cation * z_anion)
+    nu_product = nu_cation * nu_anion
+    nu_sum = nu_cation + nu_anion
+    
+    first_term = 1 - _debye_parameter_osmotic(temperature) * z_abs * sqrt_I / (1 + b * sqrt_I)
+    second_term = molality * 2 * nu_product / nu_sum * B_phi
+    third_term = molality ** 2 * ( 2 * nu_product ** 1.5 / nu_sum) * C_phi
  
     osmotic_coefficient = first_term + second_term + third_term
     
@@ -14,20 +14,8 @@ The correct case must be used when specifying elements.
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+pyEQL.logging_system.configure_logger(logger)
 
 ## Formula validation and processing functions. These internal routines
 ## parse chemical formulas into a format that can be easily processed
@@ -263,7 +251,9 @@ def _consolidate_formula(formula):
     '''
     # perform validity check and return a list of the chemical formula's components
     input_list = _remove_parentheses(formula)
-    output_list = []
+    
+    # running total of each element, in order of first appearance
+    element_counts = {}
     
     for i in range (0,len(input_list)):
         # is the item an element, a number, or a charge?
@@ -277,16 +267,13 @@ def _consolidate_formula(formula):
             except IndexError:
                 quantity = 1
                 
-            # have we seen it before?
-            if input_list[i] in output_list:
-                # yes, so find it in the output list
-                index = output_list.index(input_list[i])
-                # add the quantity
-                output_list[index+1] += int(quantity)
-            else:
-                # no, so add it and its quantity
-                output_list.append(input_list[i])
-                output_list.append(int(quantity))
+            # add the quantity to the total for this element
+            element_counts[input_list[i]] = element_counts.get(input_list[i],0) + int(quantity)
+    
+    output_list = []
+    for element, quantity in element_counts.items():
+        output_list.append(element)
+        output_list.append(quantity)
           
     # include any charge symbols
     charge = get_formal_charge(formula)
@@ -297,6 +284,33 @@ def _consolidate_formula(formula):
 
     return output_list
 
+def _parse_charge(formula):
+    '''
+    Return the formal charge of a formula that has already been validated
+    
+    The charge is read directly from the end of the formula string, which
+    must be either a run of charge symbols (e.g. 'Fe+++') or a single charge
+    symbol followed by a number (e.g. 'Fe+3').
+    
+    See Also
+    --------
+    get_formal_charge()
+    
+    '''
+    pos = max(formula.rfind('+'),formula.rfind('-'))
+    if pos == -1:
+        return 0
+    
+    symbol = formula[pos]
+    sign = 1 if symbol == '+' else -1
+    
+    # a single charge symbol followed by a number, e.g. 'SO4-2'
+    if pos < len(formula) - 1:
+        return sign * int(formula[pos+1:])
+    
+    # a run of charge symbols, e.g. 'Fe+++'
+    return sign * (len(formula) - len(formula.rstrip(symbol)))
+
 ## Truth Functions
 def is_valid_element(formula):
     '''
@@ -577,29 +591,10 @@ def get_formal_charge(formula):
     _check_formula()
     
     '''
-    # perform validity check and return a parsed list of the chemical formula
-    input_list = _check_formula(formula)
+    # perform validity check
+    _check_formula(formula)
     
-    if '+' in input_list:
-        index= input_list.index('+')
-        try:
-            formal_charge = 1 * int(input_list[index+1])
-        except:
-            formal_charge = 1
-    elif '-' in input_list:
-        index= input_list.index('-')
-        try:
-            formal_charge = -1 * int(input_list[index+1])
-        except:
-            formal_charge = -1
-    elif '+' in input_list[-1] :
-        formal_charge = int(1 * input_list[-1].count('+'))
-    elif '-' in input_list[-1] :
-        formal_charge = int(-1 * input_list[-1].count('-'))
-    else:
-        formal_charge = 0
-        
-    return formal_charge
+    return _parse_charge(formula)
 
 def get_element_mole_ratio(formula,element):
     '''
@@ -15,25 +15,16 @@ By default, pyEQL searches all files in the /database subdirectory for parameter
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+pyEQL.logging_system.configure_logger(logger)
 
 # for parameter creation functions
 import pyEQL.parameter as pm
+# for the hill_order() and is_valid_formula() functions
+import pyEQL.chemical_formula as chem
 # for file input/output functions
 import os
+from functools import lru_cache
 
 
 ## Database Management Functions
@@ -51,6 +42,10 @@ class Paramsdb:
   
         self.parameters_database={}
         
+        # names of the parameters available for each species, so that
+        # has_parameter() does not have to scan every Parameter object
+        self._parameter_names={}
+        
         # set the directory containing database files
         self.database_dir = [os.path.dirname(__file__)+'/database']
 
@@ -81,9 +76,6 @@ class Paramsdb:
         formula : str
                 String representing the chemical formula of the species.
         '''
-        # get the hill_order() and is_valid_formula() methods from the chemistry module
-        import pyEQL.chemical_formula as chem
-        
         # if the formula is already in the database, then we've already searched
         # and compiled parameters, so there is no need to do it again.    
         if formula in self.parameters_database:
@@ -91,6 +83,7 @@ class Paramsdb:
         else:
             # add an entry to the parameters database
             self.parameters_database[formula] = set()
+            self._parameter_names[formula] = set()
             
             # search all the files in each database directory
             for directory in self.database_dir:
@@ -148,13 +141,14 @@ class Paramsdb:
                                     # this allows a database entry for 'MgCl2' to be matched
                                     # even if the user enters 'Mg(Cl)2', for example
                                     elif chem.is_valid_formula(_parse_line(line)[0]):
-                                        if chem.hill_order(formula) == chem.hill_order(_parse_line(line)[0]):                                                
+                                        entry = _parse_line(line)
+                                        if _hill_order(formula) == _hill_order(entry[0]):
                                             # if there are multiple columns, pass the values as a list. 
                                             # If a single column, then just pass the value
-                                            if len(_parse_line(line)) >2:
-                                                param_value = _parse_line(line)[1:]
+                                            if len(entry) >2:
+                                                param_value = entry[1:]
                                             else:
-                                                param_value = _parse_line(line)[1]
+                                                param_value = entry[1]
                                                                                         
                                             # Create a new parameter object
                                             parameter = pm.Parameter(param_name,param_value,param_unit, \
@@ -162,14 +156,15 @@ class Paramsdb:
                                             
                                             # Add the parameter to the set for this species
                                             self.parameters_database[formula].add(parameter)
+                                            self._parameter_names[formula].add(param_name)
                                     
                                 except ValueError:                   
-                                    logger.warning('Error encountered when reading line %s in %s' % (line_num,file))
+                                    logger.warning('Error encountered when reading line %s in %s', line_num,file)
                                     continue
                         
                         # log a warning if an invalid character prevents reading a line
                         except UnicodeDecodeError:
-                                logger.warning('Invalid character found when reading %s. File skipped.' % file)
+                                logger.warning('Invalid character found when reading %s. File skipped.', file)
                             
                         current_file.close()
 
@@ -182,19 +177,11 @@ class Paramsdb:
         if self.has_species(formula) is False:
             self.search_parameters(formula)
         
-        found = False
-        
         try:
-            for item in self.parameters_database[formula]:
-                if item.get_name() == name:
-                    found = True
-                else:
-                    continue
-            
-            return found
+            return name in self._parameter_names[formula]
             
         except KeyError:
-            logger.error('Species %s not found in database' % formula)
+            logger.error('Species %s not found in database', formula)
             return None    
         
     def get_parameter(self,formula,name):
@@ -210,10 +197,10 @@ class Paramsdb:
                     return item
             
             if found == False:
-                logger.error('Parameter %s for species %s not found in database' % (name,formula))
+                logger.error('Parameter %s for species %s not found in database', name,formula)
                     
         except KeyError:
-            logger.error('Species %s not found in database' % formula)
+            logger.error('Species %s not found in database', formula)
             return None
     
     def add_parameter(self,formula,parameter):
@@ -221,6 +208,7 @@ class Paramsdb:
         Add a parameter to the database
         '''
         self.parameters_database[formula].add(parameter)
+        self._parameter_names[formula].add(parameter.get_name())
 
     def has_species(self,formula):
         '''
@@ -259,6 +247,18 @@ class Paramsdb:
                 for item in self.parameters_database[key]:
                     print(item)
 
+@lru_cache(maxsize=None)
+def _hill_order(formula):
+    '''
+    Memoized version of chemical_formula.hill_order()
+    
+    search_parameters() compares every formula in every database file to the
+    requested species, so the same database formulas are standardized again
+    each time a new species is searched. The database files contain a few
+    thousand formulas, so the cache stays small.
+    '''
+    return chem.hill_order(formula)
+
 def _parse_line(line):
     '''
     Function to parse lines in a tab-seprated value file format.
@@ -14,28 +14,27 @@ NOTE: these methods are not currently used but are here for the future.
 ## Dependencies
 # import libraries for scientific functions
 import math
+import numpy as np
+from functools import lru_cache
 
 # the pint unit registry
 from pyEQL import unit
 
+# optional numba compilation of the numerical kernels
+from pyEQL.jit import njit, prange
+
 # logging system
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
+pyEQL.logging_system.configure_logger(logger)
 
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+# constants used by the temperature adjustment functions, stored as floats
+# in SI units so they don't have to be converted on every call
+_R = (1*unit.R).to('J/mol/K').magnitude
+_T_REF = 25*unit('degC')
+_T_REF_K = _T_REF.to('K').magnitude
 
 def adjust_temp_pitzer(c1,c2,c3,c4,c5,temp,temp_ref=unit('298.15 K')):
     '''
@@ -62,26 +61,37 @@ def adjust_temp_pitzer(c1,c2,c3,c4,c5,temp,temp_ref=unit('298.15 K')):
     
     return pitzer_param
 
-def adjust_temp_vanthoff(equilibrium_constant,enthalpy,temperature,reference_temperature = 25*unit('degC')):
+def _exp(x):
+    '''
+    Return exp(x) as a float if x is a scalar, or as an array if x is an array.
+    math.exp is used for scalars so that they do not become numpy.float64
+    '''
+    if np.ndim(x) == 0:
+        return math.exp(x)
+    else:
+        return np.exp(x)
+
+def adjust_temp_vanthoff(equilibrium_constant,enthalpy,temperature,reference_temperature = _T_REF):
     '''(float,float,number, optional number) -> float
     
     Adjust a reaction equilibrium constant from one temperature to another.
     
     Parameters
     ----------
-    equilibrium_constant : float
+    equilibrium_constant : float or array
                            The reaction equilibrium constant for the reaction
     enthalpy : Quantity
                The enthalpy change (delta H) for the reaction in kJ/mol. Assumed
                independent of temperature (see Notes).
     temperature : Quantity
-                  the desired reaction temperature in degrees Celsius
+                  the desired reaction temperature in degrees Celsius. The
+                  magnitude may be an array.
     reference_temperature : Quantity, optional
                       the temperature at which equilibrium_constant is valid. (25 degrees C if omitted).
    
     Returns
     -------
-    float
+    float or array
         adjusted reaction equilibrium constant
     
     Notes
@@ -108,15 +118,28 @@ def adjust_temp_vanthoff(equilibrium_constant,enthalpy,temperature,reference_tem
     >>> adjust_temp_vanthoff(0.15,-197.6*unit('kJ/mol'),42*unit('degC')) #doctest: +ELLIPSIS
     0.00203566...
     
+    An array of temperatures can be passed to adjust the equilibrium constant
+    to several temperatures at once.
+    
+    >>> adjust_temp_vanthoff(0.15,-197.6*unit('kJ/mol'),np.array([25,42])*unit('degC')) #doctest: +ELLIPSIS
+    array([0.15      , 0.00203566])
+    
     '''
-    output = equilibrium_constant * math.exp( enthalpy / unit.R * ( 1 / reference_temperature.to('K') - 1 / temperature.to('K')))
+    # skip the unit conversion when the default reference temperature is used
+    if reference_temperature is _T_REF:
+        T_ref = _T_REF_K
+    else:
+        T_ref = reference_temperature.to('K').magnitude
     
-    logger.info('Adjusted equilibrium constant K=%s from %s to %s degrees Celsius with Delta H = %s. Adjusted K = %s % equilibrium_constant,reference_temperature,temperature,enthalpy,output')
+    output = equilibrium_constant * _exp( enthalpy.to('J/mol').magnitude / _R * ( 1 / T_ref - 1 / temperature.to('K').magnitude))
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Adjusted equilibrium constant K=%s from %s to %s degrees Celsius with Delta H = %s. Adjusted K = %s', equilibrium_constant,reference_temperature,temperature,enthalpy,output)
     
     logger.warning("Van't Hoff equation assumes enthalpy is independent of temperature over the range of interest")
     return output
 
-def adjust_temp_arrhenius(rate_constant,activation_energy,temperature,reference_temperature = 25*unit('degC')):
+def adjust_temp_arrhenius(rate_constant,activation_energy,temperature,reference_temperature = _T_REF):
     '''(float,float,number, optional number) -> float
     
     Adjust a reaction equilibrium constant from one temperature to another.
@@ -128,7 +151,7 @@ def adjust_temp_arrhenius(rate_constant,activation_energy,temperature,reference_
     activation_energy : Quantity
                The activation energy of the process, in kJ/mol
     temperature : Quantity
-                  the desired reaction temperature.
+                  the desired reaction temperature. The magnitude may be an array.
     reference_temperature : Quantity, optional
                       the temperature at which equilibrium_constant is valid
                       Defaults to 25 degrees C if omitted.
@@ -157,14 +180,36 @@ def adjust_temp_arrhenius(rate_constant,activation_energy,temperature,reference_
     --------
     >>> adjust_temp_arrhenius(7,900*unit('kJ/mol'),37*unit('degC'),97*unit('degC')) #doctest: +ELLIPSIS
     1.8867225...e-24
+    >>> adjust_temp_arrhenius(7,900*unit('kJ/mol'),np.array([37,97])*unit('degC'),97*unit('degC')) #doctest: +ELLIPSIS
+    array([1.8867226e-24, 7.0000000e+00])
     
     '''
-    output = rate_constant * math.exp( activation_energy / unit.R * ( 1 / reference_temperature.to('K') - 1 / temperature.to('K')))
+    # skip the unit conversion when the default reference temperature is used
+    if reference_temperature is _T_REF:
+        T_ref = _T_REF_K
+    else:
+        T_ref = reference_temperature.to('K').magnitude
+    
+    output = rate_constant * _exp( activation_energy.to('J/mol').magnitude / _R * ( 1 / T_ref - 1 / temperature.to('K').magnitude))
     
-    logger.info('Adjusted parameter %s from %s to %s degrees Celsius with Activation Energy = %s kJ/mol. Adjusted value = %s % rate_constant,reference_temperature,temperature,activation_energy,output')
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Adjusted parameter %s from %s to %s with Activation Energy = %s. Adjusted value = %s', rate_constant,reference_temperature,temperature,activation_energy,output)
     
     return output
 
+@lru_cache(maxsize=64)
+def _pKa_to_ka(pKa_tuple):
+    '''
+    Convert a tuple of pKa values into an array of acid dissociation constants.
+    
+    alpha() is often called many times for the same acid, so the conversion
+    is memoized. The returned array is read-only because it is shared
+    between callers.
+    '''
+    ka = np.power(10.0, -np.asarray(pKa_tuple,dtype=float))
+    ka.flags.writeable = False
+    return ka
+
 def alpha(n,pH,pKa_list):
     '''(int,number,list of numbers)
     Returns the acid-base distribution coefficient (alpha) of an acid in the 
@@ -210,13 +255,13 @@ def alpha(n,pH,pKa_list):
     >>> alpha(0,8,[6.35,10.33]) #doctest: +ELLIPSIS
     0.021...
     >>> alpha(1,8,[6.35,10.33]) #doctest: +ELLIPSIS
-    0.979...
+    0.973...
     >>> alpha(2,8,[6.35,10.33]) #doctest: +ELLIPSIS
-    2.043...e-09
+    0.0045...
     
-    If pH is equal to one of the pKa values the function should return 0.5.
+    If pH is equal to the pKa of a monoprotic acid the function should return 0.5.
     
-    >>> alpha(1,6.35,[6.35,10.33])
+    >>> alpha(1,6.35,[6.35])
     0.5
     
 #     The function will return an error if the number ofpKa's is less than n.
@@ -237,31 +282,99 @@ def alpha(n,pH,pKa_list):
         return None
         
     #convert pH to hydrogen ion concentration
-    Hplus = 10 ** -pH
+    Hplus = 10.0 ** -pH
     
     #determine how many protons the acid has
     num_protons = len(pKa_list)
     
-    #build a list of terms where the term subscript corresponds to the list index
-    terms_list = []
-    k_term = 1
+    #build an array of terms where the term subscript corresponds to the index.
+    #term_i = ka1 * ka2 * ... * ka_i * [H+]^(num_protons - i), so the products
+    #of k values are just the cumulative product of the ka's
+    ka = _pKa_to_ka(tuple(pKa_list))
+    k_terms = np.concatenate(([1.0], np.cumprod(ka)))
+    powers = np.arange(num_protons,-1,-1)
+    terms = k_terms * Hplus ** powers
     
-    #the 'item' index counts from 0 to the number of protons, inclusive
-    for item in range(0,num_protons+1):
-        #multiply the preceding k values together
-        for i in range(len(pKa_list[:item])):
-            k_term *= 10 ** -pKa_list[i]
-        
-        #add the term to the list
-        terms_list.append(k_term * Hplus ** (num_protons - item))
-    
-    #build the expression
-    numerator = terms_list[n]
-    denominator = 0
-    for item in terms_list:
-        denominator += item
-        
     #return the desired distribution factor
-    alpha = numerator / denominator
-    logger.info('Calculated %s-deprotonated acid distribution coefficient of %s for pKa=%s at pH %s % n,alpha,pKa_list,pH')
+    alpha = float(terms[n] / terms.sum())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Calculated %s-deprotonated acid distribution coefficient of %s for pKa=%s at pH %s', n,alpha,pKa_list,pH)
     return alpha
+
+@njit(parallel=True,cache=True)
+def _alpha_batch(n,Hplus,ka):
+    '''
+    Numerical core of alpha_batch(). Operates on float arrays of hydrogen ion
+    concentrations and acid dissociation constants.
+    '''
+    num_protons = ka.shape[0]
+    output = np.empty(Hplus.shape[0])
+    
+    for k in prange(Hplus.shape[0]):
+        h = Hplus[k]
+        numerator = 0.0
+        denominator = 0.0
+        k_term = 1.0
+        h_term = h ** num_protons
+        # term_i = ka1 * ka2 * ... * ka_i * [H+]^(num_protons - i)
+        for i in range(num_protons+1):
+            term = k_term * h_term
+            denominator += term
+            if i == n:
+                numerator = term
+            if i < num_protons:
+                k_term *= ka[i]
+                h_term /= h
+        output[k] = numerator / denominator
+    
+    return output
+
+def alpha_batch(n,pH,pKa_list):
+    '''(int,array of numbers,list of numbers)
+    Returns the acid-base distribution coefficient (alpha) of an acid in the 
+    n-deprotonated form at each of an array of pH values.
+    
+    This is equivalent to calling alpha() for each pH, but is much faster for
+    the large numbers of pH values used in e.g. titration or speciation curves.
+    
+    Parameters
+    ----------
+    n : int
+        The number of protons that have been lost by the desired form of the
+        acid. See alpha()
+    pH : array of floats or ints
+         The pH values at which to calculate alpha.
+    pKa_list : list of floats or ints
+               The pKa values (negative log of equilibrium constants) for the acid
+               of interest. There must be a minimum of n pKa values in the list.
+    
+    Returns
+    -------
+    numpy.ndarray
+        The fraction of total acid present in the specified form at each pH.
+    
+    See Also
+    --------
+    alpha
+    
+    Examples
+    --------
+    >>> alpha_batch(1,[4.7,8],[4.7]) #doctest: +ELLIPSIS
+    array([0.5       , 0.999...])
+    
+    '''
+    #generate an error if no pKa values are specified
+    if len(pKa_list) == 0:
+        logger.error('No pKa values given. Cannot calculate distribution coeffiicent.')
+        return None
+    
+    #generate an error if n > number of pKa values
+    if len(pKa_list) < n:
+        logger.error('Insufficient number of pKa values given. Cannot calculate distribution coeffiicent.')
+        return None
+    
+    #convert pH and pKa to concentration units once for the whole array
+    Hplus = np.power(10.0, -np.asarray(pH,dtype=float).ravel())
+    ka = _pKa_to_ka(tuple(pKa_list))
+    
+    return _alpha_batch(n,Hplus,ka)
@@ -11,9 +11,12 @@ pyEQL functions that take Solution objects as inputs or return Solution objects
 ## Dependencies
 # import libraries for scientific functions
 import math
+import itertools
+import numpy as np
+from scipy.optimize import brentq
 
 # internal pyEQL imports
-import pyEQL
+from pyEQL.solution import Solution
 
 # import the parameters database
 from pyEQL import paramsDB as db
@@ -25,20 +28,8 @@ from pyEQL import unit
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+pyEQL.logging_system.configure_logger(logger)
 
 def gibbs_mix(Solution1, Solution2):
     '''
@@ -84,16 +75,19 @@ def gibbs_mix(Solution1, Solution2):
     concentrate = Solution1
     dilute = Solution2
     blend = mix(Solution1,Solution2)
-    term_list = {concentrate:0, dilute:0, blend:0}
+    solutions = (concentrate, dilute, blend)
+    term_list = [0, 0, 0]
     temperature = blend.get_temperature()
 
     # calculate the entropy change and number of moles solute for each solution
-    for solution in term_list:
-        for solute in solution.components:
-            if not solution.get_amount(solute,'fraction') == 0:
-                term_list[solution] += solution.get_amount(solute,'mol') * math.log(solution.get_activity(solute))
+    for i, solution in enumerate(solutions):
+        moles = solution.get_amounts_array('mol')
+        activity = solution.get_activities_array()
+        # components with zero mole fraction do not contribute
+        mask = moles > 0
+        term_list[i] = np.dot(moles[mask],np.log(activity[mask]))
 
-    return (unit.R * temperature.to('K') * (term_list[blend] - term_list[concentrate] - term_list[dilute])).to('J')
+    return (unit.R * temperature.to('K') * (term_list[2] - term_list[0] - term_list[1]) * unit('mol')).to('J')
 
 def entropy_mix(Solution1, Solution2):
     '''
@@ -139,16 +133,20 @@ def entropy_mix(Solution1, Solution2):
     concentrate = Solution1
     dilute = Solution2
     blend = mix(Solution1,Solution2)
-    term_list = {concentrate:0, dilute:0, blend:0}
+    solutions = (concentrate, dilute, blend)
+    term_list = [0, 0, 0]
     temperature = blend.get_temperature()
 
     # calculate the entropy change and number of moles solute for each solution
-    for solution in term_list:
-        for solute in solution.components:
-            if not solution.get_amount(solute,'fraction') == 0:
-                term_list[solution] += solution.get_amount(solute,'mol') * math.log(solution.get_amount(solute,'fraction'))
+    for i, solution in enumerate(solutions):
+        moles = solution.get_amounts_array('mol')
+        # mole fractions, without calling get_amount a second time for each solute
+        fraction = moles / moles.sum()
+        # components with zero mole fraction do not contribute
+        mask = moles > 0
+        term_list[i] = np.dot(moles[mask],np.log(fraction[mask]))
 
-    return (unit.R * temperature.to('K') * (term_list[blend] - term_list[concentrate] - term_list[dilute])).to('J')
+    return (unit.R * temperature.to('K') * (term_list[2] - term_list[0] - term_list[1]) * unit('mol')).to('J')
 
 def donnan_eql(solution,fixed_charge):
     '''
@@ -294,8 +292,6 @@ def donnan_eql(solution,fixed_charge):
         return (act_cation_mem/act_cation_soln) ** (1/z_cation) * (act_anion_soln/act_anion_mem)**(1/z_anion) - math.exp(delta_pi * exp_term)
 
     # solve the function above using one of scipy's nonlinear solvers
-
-    from scipy.optimize import brentq
     
     # determine which ion concentration represents the co-ion
     # call a nonlinear solver to adjust the concentrations per the donnan
@@ -358,30 +354,32 @@ def mix(Solution1, Solution2):
     
     blend_temperature = str((t1 * v1 + t2 * v2) / (v1 + v2))
           
-    # retrieve the amount of each component in the parent solution and 
-    # store in a list.
-    mix_species={}
-    for item in Solution1.components:
-        mix_species.update({item:str(Solution1.get_amount(item,'mol'))})
-    for item in Solution2.components:
-        if item in mix_species:
-            new_amt = str(unit(mix_species[item]) + Solution2.get_amount(item,'mol'))
-            mix_species.update({item:new_amt})
-        else:
-            mix_species.update({item:Solution2.get_amount(item,'mol')}) 
-            
+    # merge the components of both parent solutions, preserving the order in
+    # which they appear, and total the amount of each one
+    components1 = Solution1.components
+    components2 = Solution2.components
+    mix_species = dict.fromkeys(itertools.chain(components1,components2))
+    
+    keys1 = components1.keys()
+    keys2 = components2.keys()
+    for item in keys1 - keys2:
+        mix_species[item] = components1[item].moles
+    for item in keys2 - keys1:
+        mix_species[item] = components2[item].moles
+    for item in keys1 & keys2:
+        mix_species[item] = components1[item].moles + components2[item].moles
     
     # create an empty solution for the mixture
-    Blend = pyEQL.Solution(temperature = blend_temperature,pressure= blend_pressure)
+    Blend = Solution(temperature = blend_temperature,pressure= blend_pressure)
     
     # set or add the appropriate amount of all the components
     for item in mix_species.keys():
         if item in Blend.components:
             # if already present (e.g. H2O, H+), modify the amount
-            Blend.set_amount(item,mix_species[item])
+            Blend.set_amount(item,str(mix_species[item]))
         else:
             # if not already present, add the component
-            Blend.add_solute(item,mix_species[item])
+            Blend.add_solute(item,str(mix_species[item]))
             
     return Blend
 
@@ -514,9 +512,9 @@ def autogenerate(solution=""):
         ['C3H5O3-','28 mmol/L']
         ]
     else:
-        logger.error('Invalid solution entered - %s' % solution)
+        logger.error('Invalid solution entered - %s', solution)
         return None
         
-    sol = pyEQL.Solution(solutes,temperature=temperature,pressure=pressure,pH=pH)
+    sol = Solution(solutes,temperature=temperature,pressure=pressure,pH=pH)
     
     return sol
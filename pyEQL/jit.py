@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+pyEQL just-in-time compilation support
+
+This file provides the decorators used to compile pyEQL's numerical kernels
+with numba. numba is an optional dependency. If it is not installed, the
+decorators leave the functions unchanged and they run as ordinary Python.
+
+:copyright: 2013-2018 by Ryan S. Kingsbury
+:license: LGPL, see LICENSE for more details.
+
+'''
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args,**kwargs):
+        '''
+        Stand-in for numba.njit that returns the decorated function unchanged.
+        Supports both the @njit and @njit(...) forms.
+        '''
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
@@ -23,27 +23,57 @@ CRITICAL    -   not used
 
 '''
 import logging
+from collections import OrderedDict
 # define a log filter to emit only unique log messages
 class Unique(logging.Filter):
     """Messages are allowed through just once.
     The 'message' includes substitutions, but is not formatted by the 
     handler. If it were, then practically all messages would be unique!
+    
+    Only the 'maxsize' most recent unique messages are remembered, so that the
+    memory used by the filter does not grow without bound during long
+    calculations. When the limit is reached, the oldest message is forgotten
+    and will be emitted again if it recurs.
     """
-    def __init__(self, name=""):
+    def __init__(self, name="", maxsize=1024):
         logging.Filter.__init__(self, name)
+        self.maxsize = maxsize
         self.reset()
     def reset(self):
         """Act as if nothing has happened."""
-        self.__logged = {}
+        self.__logged = OrderedDict()
     def filter(self, rec):
         """logging.Filter.filter performs an extra filter on the name."""
         return logging.Filter.filter(self, rec) and self.__is_first_time(rec)
     def __is_first_time(self, rec):
         """Emit a message only once."""
-        msg = rec.msg %(rec.args)
+        msg = rec.getMessage()
         if msg in self.__logged:
             self.__logged[msg] += 1
             return False
         else:
             self.__logged[msg] = 1
+            # forget the oldest message
+            if len(self.__logged) > self.maxsize:
+                self.__logged.popitem(last=False)
             return True
+
+def configure_logger(logger):
+    """Attach the pyEQL console handler and Unique filter to 'logger'.
+    
+    Each pyEQL module calls this for its own logger at import time. Nothing is
+    done if the logger already has a handler, so that reloading a module does
+    not attach a second handler (which would print every message twice).
+    """
+    if logger.handlers:
+        return
+    
+    # add a filter to emit only unique log messages to the handler
+    logger.addFilter(Unique())
+    
+    # add a handler for console output, since pyEQL is meant to be used interactively
+    handler = logging.StreamHandler()
+    
+    # create formatter for the log
+    handler.setFormatter(logging.Formatter('(%(name)s) - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
@@ -13,27 +13,18 @@ used throughout pyEQL.
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+pyEQL.logging_system.configure_logger(logger)
 
 ## Units handling
 # per the pint documentation, it's important that pint and its associated Unit
 # Registry are only imported once.
-from pint import UnitRegistry
+from pint import UnitRegistry, set_application_registry
 # here we assign the identifier 'unit' to the UnitRegistry
 unit = UnitRegistry()
+# unpickled Quantities are created in the application registry, so make it
+# this one. Otherwise a Solution loaded from a pickle can't be used.
+set_application_registry(unit)
 
 #use this to enable legacy handling of offset units
 # TODO fix this to handle offsets the way pint wants us to since 0.7
@@ -54,7 +45,7 @@ def testfunc(val):
         list.append(float(val) * unit(''))
         return list
     except ValueError:
-        print('Value Error')
+        logger.debug('Could not convert %s to a number', val)
         return None
 
 
@@ -169,10 +160,10 @@ class Parameter:
                 try:
                     temp_list.append(float(item) * unit(use_units))
                 except ValueError:
-                    print('Value Error on %s' % item)
+                    logger.debug('Could not convert %s to a number; storing it as a non-numeric value', item)
                     # Throw an error if units are assigned to a non-numeric parameter
                     if not (use_units == 'dimensionless'):
-                        logger.error('A non-numeric parameter cannot have units, but units of %s were specified' % units)
+                        logger.error('A non-numeric parameter cannot have units, but units of %s were specified', units)
                     temp_list.append(item)
                     
             # convert the resulting list into a tuple
@@ -186,7 +177,7 @@ class Parameter:
             except ValueError:
                 # Throw an error if units are assigned to a non-numeric parameter
                 if not (use_units == 'dimensionless'):
-                    logger.error('A non-numeric parameter cannot have units, but units of %s were specified' % units)
+                    logger.error('A non-numeric parameter cannot have units, but units of %s were specified', units)
                 
                 self.value = magnitude
             
@@ -267,38 +258,35 @@ class Parameter:
         # base_pressure, and/or base_ionic_strength
         if temperature is None: 
             temperature = self.base_temperature
-            logger.info('Temperature not specified for '+str(self.name)+'. Returning value at '+str(temperature)+'.')
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Temperature not specified for %s. Returning value at %s.', self.name,temperature)
         else:
             temperature = unit(temperature)
         if pressure is None: 
             pressure = self.base_pressure
-            logger.info('Pressure not specified for '+str(self.name)+'. Returning value at '+str(pressure)+'.')
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Pressure not specified for %s. Returning value at %s.', self.name,pressure)
         else:
             pressure = unit(pressure)
         if ionic_strength is None: 
             ionic_strength = self.base_ionic_strength
-            logger.info('Ionic Strength not specified for '+str(self.name)+'. Returning value at '+str(ionic_strength)+'.')
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Ionic Strength not specified for %s. Returning value at %s.', self.name,ionic_strength)
         else:
             ionic_strength = unit(ionic_strength)
         
         # compare requested conditions with base conditions
         if temperature != self.base_temperature:        
             # TODO- implement temperature correction
-            logger.warning('Requested temperature for '+str(self.name)+ \
-            ' ('+str(temperature)+') differs from measurement conditions.' \
-            +'Returning value at '+str(self.base_temperature))
+            logger.warning('Requested temperature for %s (%s) differs from measurement conditions.Returning value at %s', self.name,temperature,self.base_temperature)
             
         if pressure != self.base_pressure:        
             # TODO - implement pressure correction
-            logger.warning('Requested pressure for '+str(self.name)+ \
-            ' ('+str(pressure)+') differs from measurement conditions.' \
-            +'Returning value at '+str(self.base_pressure))
+            logger.warning('Requested pressure for %s (%s) differs from measurement conditions.Returning value at %s', self.name,pressure,self.base_pressure)
         
         
         if ionic_strength != self.base_ionic_strength:        
-            logger.warning('Requested ionic strength for '+str(self.name)+ \
-            ' ('+str(ionic_strength)+') differs from measurement conditions.' \
-            +'Returning value at '+str(self.base_ionic_strength))
+            logger.warning('Requested ionic strength for %s (%s) differs from measurement conditions.Returning value at %s', self.name,ionic_strength,self.base_ionic_strength)
         
         return self.value
         
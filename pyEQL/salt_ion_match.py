@@ -17,20 +17,8 @@ species (e.g. Na+)
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+pyEQL.logging_system.configure_logger(logger)
 
 import pyEQL.chemical_formula as chem
 
@@ -155,10 +143,10 @@ def _sort_components(Solution,type='all'):
         if type == 'all':
             formula_list.append(item)
         elif type == 'cations':
-            if Solution.get_solute(item).get_formal_charge() > 0:
+            if Solution.components[item].charge > 0:
                 formula_list.append(item)
         elif type == 'anions':
-            if Solution.get_solute(item).get_formal_charge() < 0:
+            if Solution.components[item].charge < 0:
                 formula_list.append(item)
 
     # populate a dictionary with formula:concentration pairs
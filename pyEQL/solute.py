@@ -21,32 +21,30 @@ from pyEQL import unit
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
-
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+pyEQL.logging_system.configure_logger(logger)
 
 # import the parameters database
 from pyEQL import paramsDB as db
 
+# the chemical formula interpreter and parameter creation functions
+import pyEQL.chemical_formula as chem
+import pyEQL.parameter as pm
+
+# amounts already in units of substance convert to moles without the 'chem' context
+_SUBSTANCE_DIMENSIONALITY = unit('mol').dimensionality
+
 class Solute:
     '''
     represent each chemical species as an object containing its formal charge, 
     transport numbers, concentration, activity, etc. 
     
     '''
+    # a solution may contain many solutes, so store their attributes in fixed
+    # slots rather than a per-instance dictionary
+    __slots__ = ('formula','_parent','parameters','mw','charge','_moles')
     
-    def __init__(self,formula,amount,volume,solvent_mass,parameters={}):
+    def __init__(self,formula,amount,volume,solvent_mass,parameters=None):
         '''
         Parameters
         ----------
@@ -63,26 +61,34 @@ class Solute:
         parameters : dictionary, optional
                     Dictionary of custom parameters, such as diffusion coefficients, transport numbers, etc. Specify parameters as key:value pairs separated by commas within curly braces, e.g. {diffusion_coeff:5e-10,transport_number:0.8}. The 'key' is the name that will be used to access the parameter, the value is its value.
         '''             
-        # import the chemical formula interpreter module
-        import pyEQL.chemical_formula as chem
-        
         # check that 'formula' is a valid chemical formula
         if not chem.is_valid_formula:
             logger.error('Invalid chemical formula specified.')
             return None
         else:
             self.formula = formula
+            
+            # the Solution this solute belongs to, if any. Set by the Solution
+            # when the solute is added to it; see the 'moles' property
+            self._parent = None
+            
+            # store any custom parameters supplied by the user
+            self.parameters = parameters if parameters is not None else {}
 
             # set molecular weight 
             self.mw = chem.get_molecular_weight(formula) * unit('g/mol')
             
-            # set formal charge
-            self.charge = chem.get_formal_charge(formula)
+            # set formal charge. The formula was already validated by
+            # get_molecular_weight(), so read the charge directly
+            self.charge = chem._parse_charge(formula)
             
             # translate the 'amount' string into a pint Quantity
             quantity = unit(amount)
             
-            self.moles = quantity.to('moles','chem',mw=self.mw,volume=volume,solvent_mass=solvent_mass)                
+            if quantity.dimensionality == _SUBSTANCE_DIMENSIONALITY:
+                self.moles = quantity.to('moles')
+            else:
+                self.moles = quantity.to('moles','chem',mw=self.mw,volume=volume,solvent_mass=solvent_mass)                
 
             # trigger the function that checks whether parameters already exist for this species, and if not,
             # searches the database files and creates them
@@ -108,7 +114,6 @@ class Solute:
         See pyEQL.parameters documentation for a description of the arguments
         
         '''
-        import pyEQL.parameter as pm
         newparam = pm.Parameter(name,magnitude,units,**kwargs)
         db.add_parameter(self.get_name(),newparam)
         
@@ -159,6 +164,40 @@ class Solute:
         '''
         return self.mw
     
+    @property
+    def moles(self):
+        '''
+        The amount of solute in the solution, in moles
+        
+        Setting this attribute notifies the parent Solution (if any) so that
+        it can discard any cached properties that depend on composition.
+        '''
+        return self._moles
+    
+    @moles.setter
+    def moles(self,value):
+        self._moles = value
+        
+        # a weak reference is used so that solutes do not keep their parent alive
+        if self._parent is not None:
+            parent = self._parent()
+            if parent is not None:
+                parent._invalidate_aggregates()
+    
+    def __getstate__(self):
+        '''
+        Return the state of the solute for pickling and copying
+        
+        The weak reference to the parent Solution can't be pickled, so it is
+        omitted. The Solution restores it when it is itself unpickled or copied.
+        '''
+        return {name: getattr(self,name) for name in self.__slots__ if name != '_parent' and hasattr(self,name)}
+    
+    def __setstate__(self,state):
+        self._parent = None
+        for name, value in state.items():
+            setattr(self,name,value)
+    
     def get_moles(self):
         '''
         Return the moles of solute in the solution
@@ -11,11 +11,19 @@ pyEQL Solution Class
 ## Dependencies
 # import libraries for scientific functions
 import math
+import bisect
+import weakref
+import copy
+import numpy as np
+from functools import lru_cache
 
 # internal pyEQL imports
 import pyEQL.activity_correction as ac
 import pyEQL.water_properties as h2o
 import pyEQL.solute as sol
+import pyEQL.salt_ion_match as salt
+import pyEQL.chemical_formula as chem
+from pyEQL.jit import njit
 
 # the pint unit registry
 from pyEQL import unit
@@ -27,20 +35,83 @@ from pyEQL import paramsDB as db
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
-
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
-
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
+pyEQL.logging_system.configure_logger(logger)
+
+# dimensionalities of amounts given on a per-volume basis. Comparing against
+# these avoids re-parsing a dimensionality string on every comparison
+_PER_VOLUME_DIMENSIONALITY = (unit('mol/L').dimensionality, unit('g/L').dimensionality)
+
+# conversions used by Solution.get_amount() and Solution.get_amounts_array(), keyed
+# by the dimensionality of the requested unit. Each entry gives a base unit and a
+# function that converts moles (mol) and molecular weights (g/mol), either plain
+# numbers or arrays, into magnitudes in that base unit
+_GET_AMOUNT_DISPATCH = {
+    unit('mol/L').dimensionality: ('mol/L', lambda soln, moles, mw: moles / soln.get_volume().to('L').magnitude),
+    unit('g/L').dimensionality: ('g/L', lambda soln, moles, mw: moles * mw / soln.get_volume().to('L').magnitude),
+    unit('mol/kg').dimensionality: ('mol/kg', lambda soln, moles, mw: moles / soln.get_solvent_mass().to('kg').magnitude),
+    unit('g/kg').dimensionality: ('g/kg', lambda soln, moles, mw: moles * mw / soln.get_solvent_mass().to('kg').magnitude),
+    unit('g').dimensionality: ('g', lambda soln, moles, mw: moles * mw),
+    unit('mol').dimensionality: ('mol', lambda soln, moles, mw: moles),
+}
+
+@lru_cache(maxsize=128)
+def _amount_conversion(units):
+    '''
+    Return the _GET_AMOUNT_DISPATCH function for 'units' and the factor that
+    converts its base unit into 'units', or None if the units are not supported.
+    
+    Parsing a unit string with pint takes far longer than the conversion itself,
+    so the result is cached for each unit string.
+    '''
+    try:
+        base_units, conversion = _GET_AMOUNT_DISPATCH[unit(units).dimensionality]
+    except KeyError:
+        return None
+    
+    return conversion, unit(base_units).to(units).magnitude
+
+# the activity models used by Solution.get_activity_coefficient() when Pitzer
+# parameters are not available, and the upper limit of ionic strength (mol/kg)
+# over which each one is valid, in increasing order
+_ACTIVITY_MODEL_LIMITS = (ac.DEBYEHUCKEL_LIMIT, ac.GUNTELBERG_LIMIT, ac.DAVIES_LIMIT)
+_ACTIVITY_MODELS = (
+    ('Debye-Huckel', ac.get_activity_coefficient_debyehuckel),
+    ('Guntelberg', ac.get_activity_coefficient_guntelberg),
+    ('Davies equation', ac.get_activity_coefficient_davies),
+)
+
+# grams per kilogram, for converting masses computed from molecular weights in g/mol
+_G_PER_KG = 1000.0
+
+# the parts of the Debye and Bjerrum lengths that depend only on physical constants.
+# See get_debye_length() and get_bjerrum_length()
+_DEBYE_LENGTH_PREFACTOR = (unit.epsilon_0 * unit.k * unit('K') / (2 * unit.N_A * unit.e ** 2 * unit('mol/L'))).to('nm ** 2').magnitude
+_BJERRUM_LENGTH_PREFACTOR = (unit.e ** 2 / (4 * math.pi * unit.epsilon_0 * unit.k * unit('K'))).to('nm').magnitude
+
+# the Faraday constant (C/mol) and the ideal gas constant (J/mol/K), for the
+# transport property kernels below
+_FARADAY_CONSTANT = unit('e * N_A').to('C/mol').magnitude
+_GAS_CONSTANT = unit('R').to('J/mol/K').magnitude
+
+@lru_cache(maxsize=128)
+def _faraday_squared_over_RT(temperature):
+    '''
+    Return F^2 / (R T), in S s/mol, at absolute temperature (K)
+    
+    The same temperature is typically reused for every ion in a solution,
+    so the result is cached.
+    '''
+    return _FARADAY_CONSTANT ** 2 / (_GAS_CONSTANT * temperature)
 
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+@njit(cache=True)
+def _nernst_einstein(z,D,F2_RT):
+    '''
+    Return the molar conductivity (S m**2/mol) of an ion with charge z and
+    diffusion coefficient D (m**2/s) according to the Nernst-Einstein relation,
+    given F2_RT = F^2 / (R T). See Solution.get_molar_conductivity()
+    '''
+    return z ** 2 * D * F2_RT
 
 class Solution:
     '''
@@ -110,6 +181,16 @@ class Solution:
                         
         # create an empty dictionary of components
         self.components={}
+        
+        # initialize the cached arrays of per-component properties
+        self._component_keys = ()
+        self._mw = np.zeros(0)
+        self._charge = np.zeros(0)
+        self._charge_squared = np.zeros(0)
+        self._solute_mask = np.zeros(0,dtype=bool)
+        
+        # initialize the cache of properties that depend only on composition
+        self._aggregates = {}
 
         # initialize the volume recalculation flag
         self.volume_update_required = False        
@@ -146,7 +227,7 @@ class Solution:
         for item in solutes:
             self.add_solute(*item)        
 
-    def add_solute(self,formula,amount,parameters={}):
+    def add_solute(self,formula,amount,parameters=None):
         '''Primary method for adding substances to a pyEQL solution
         
         Parameters
@@ -165,14 +246,14 @@ class Solution:
         # if units are given on a per-volume basis, 
         # iteratively solve for the amount of solute that will preserve the
         # original volume and result in the desired concentration  
-        if unit(amount).dimensionality in ('[substance]/[length]**3','[mass]/[length]**3'):
+        if unit(amount).dimensionality in _PER_VOLUME_DIMENSIONALITY:
             
             # store the original volume for later
             orig_volume = self.get_volume()
             
             # add the new solute
             new_solute = sol.Solute(formula,amount,self.get_volume(),self.get_solvent_mass(),parameters)
-            self.components.update({new_solute.get_name():new_solute})            
+            self._register_component(new_solute)
             
             # calculate the volume occupied by all the solutes
             solute_vol = self._get_solute_volume()
@@ -182,7 +263,7 @@ class Solution:
             
             # adjust the amount of solvent
             target_mass = target_vol * h2o.water_density(self.get_temperature())
-            mw = self.get_solvent().get_molecular_weight()
+            mw = self.get_solvent().mw
             target_mol = target_mass / mw
             self.get_solvent().moles = target_mol
             
@@ -190,7 +271,7 @@ class Solution:
             
             # add the new solute
             new_solute = sol.Solute(formula,amount,self.get_volume(),self.get_solvent_mass(),parameters)
-            self.components.update({new_solute.get_name():new_solute})            
+            self._register_component(new_solute)
             
             # update the volume to account for the space occupied by all the solutes
             # make sure that there is still solvent present in the first place
@@ -206,7 +287,7 @@ class Solution:
         Same as add_solute but omits the need to pass solvent mass to pint
         '''
         new_solvent = sol.Solute(formula,amount,self.get_volume(),amount)
-        self.components.update({new_solvent.get_name():new_solvent})
+        self._register_component(new_solvent)
                         
     def get_solute(self,i):
         '''
@@ -294,10 +375,11 @@ class Solution:
         get_amount()
         '''
         # return the total mass (kg) of the solvent
-        solvent = self.get_solvent()
-        mw = solvent.get_molecular_weight()
-    
-        return solvent.get_moles().to('kg','chem',mw=mw)
+        if 'solvent_mass' not in self._aggregates:
+            solvent = self.get_solvent()
+            self._aggregates['solvent_mass'] = solvent.moles.m_as('mol') * solvent.mw.m_as('g/mol') / _G_PER_KG
+        
+        return unit.Quantity(self._aggregates['solvent_mass'],'kg')
             
     def get_volume(self):
         '''
@@ -316,8 +398,17 @@ class Solution:
         if self.volume_update_required is True:
             self._update_volume()
             self.volume_update_required = False
-            
-        return self.volume.to('L')
+        
+        # cache the volume in L, keyed by the magnitude and units of self.volume,
+        # so that the conversion is repeated only when self.volume changes
+        # (whether it is replaced or modified in place)
+        key = (self.volume.magnitude,self.volume.units)
+        cached = self._aggregates.get('volume')
+        if cached is None or cached[0] != key:
+            cached = (key, self.volume.to('L').magnitude)
+            self._aggregates['volume'] = cached
+        
+        return unit.Quantity(cached[1],'L')
         
     def set_volume(self,volume):
         '''Change the total solution volume to volume, while preserving
@@ -366,10 +457,11 @@ class Solution:
         Quantity: the mass of the solution, in kg        
         
         '''
-        total_mass = 0
-        for item in self.components:
-            total_mass+= self.get_amount(item,'kg')
-        return total_mass.to('kg')
+        if 'mass' not in self._aggregates:
+            moles, mw, charge = self._get_component_arrays()
+            self._aggregates['mass'] = float(np.dot(moles,mw)) / _G_PER_KG
+        
+        return unit.Quantity(self._aggregates['mass'],'kg')
         
     def get_density(self):
         '''
@@ -414,18 +506,20 @@ class Solution:
         '''
         di_water = h2o.water_dielectric_constant(self.get_temperature())
         
+        # mole fractions of all the components, of which only the solutes
+        # (i.e. not the solvent) are used
+        fraction = self.get_amounts_array('fraction')
+        
         denominator = 1
-        for item in self.components:
-            # ignore water
-            if item != 'H2O':
-                # skip over solutes that don't have parameters
-                try:
-                    fraction = self.get_amount(item,'fraction')
-                    coefficient= self.get_solute(item).get_parameter('dielectric_parameter_water')
-                    denominator += coefficient * fraction
-                except TypeError:
-                    logger.warning('No dielectric parameters found for species %s.' % item)
-                    continue        
+        for i in np.flatnonzero(self._solute_mask):
+            item = self._component_keys[i]
+            # skip over solutes that don't have parameters
+            try:
+                coefficient= self.components[item].get_parameter('dielectric_parameter_water')
+                denominator += coefficient * fraction[i]
+            except TypeError:
+                logger.warning('No dielectric parameters found for species %s.', item)
+                continue        
         
         dielectric_constant = di_water / denominator
         
@@ -533,7 +627,7 @@ class Solution:
             b1 = params.get_value()[3]
         else:
             # proceed with the coefficients equal to zero and log a warning
-            logger.warning('Viscosity coefficients for %s not found. Viscosity will be approximate.' % salt.formula)
+            logger.warning('Viscosity coefficients for %s not found. Viscosity will be approximate.', salt.formula)
 
         # compute the delta G parameters
         temperature = self.get_temperature().to('degC')
@@ -547,7 +641,7 @@ class Solution:
         MW= self.get_mass() / (self.get_moles_solvent() + self.get_total_moles_solute())
         
         # get the MW of water
-        MW_w = self.get_solvent().get_molecular_weight()
+        MW_w = self.get_solvent().mw
         
         # calculate the cation mole fraction
         x_cat = self.get_amount(cation,'fraction')
@@ -602,26 +696,30 @@ class Solution:
         get_activity_coefficient()
         
         '''
-        EC = 0 * unit('S/m')
-        temperature = self.get_temperature()
+        # accumulate the conductivity as a plain number in S/m
+        EC = 0
+        F2_RT = _faraday_squared_over_RT(self.get_temperature().to('K').magnitude)
+        ionic_strength = self.get_ionic_strength().magnitude
         
         for item in self.components:
-            z = abs(self.get_solute(item).get_formal_charge())
+            z = abs(self.components[item].charge)
             # ignore uncharged species            
             if not z == 0:
                 # determine the value of the exponent alpha 
-                if self.get_ionic_strength().magnitude < 0.36 * z:
+                if ionic_strength < 0.36 * z:
                     alpha = 0.6 / z ** 0.5
                 else:
-                    alpha = self.get_ionic_strength().magnitude ** 0.5 / z
+                    alpha = ionic_strength ** 0.5 / z
                 
-                diffusion_coefficient = self.get_property(item,'diffusion_coefficient')
+                diffusion_coefficient = self.get_property(item,'diffusion_coefficient').to('m**2/s').magnitude
         
-                molar_cond = diffusion_coefficient * (unit.e * unit.N_A) ** 2 * self.get_solute(item).get_formal_charge() ** 2 / (unit.R * temperature)
+                molar_cond = _nernst_einstein(z,diffusion_coefficient,F2_RT)
+                
+                gamma = self.get_activity_coefficient(item).to('dimensionless').magnitude
                            
-                EC += molar_cond * self.get_activity_coefficient(item) ** alpha * self.get_amount(item,'mol/L')
+                EC += molar_cond * gamma ** alpha * self.get_amount(item,'mol/m**3').magnitude
                              
-        return EC.to('S/m')
+        return EC * unit('S/m')
     
     def get_osmotic_pressure(self):
         ''' 
@@ -673,7 +771,8 @@ class Solution:
         partial_molar_volume_water = 1.82e-5 *unit('m ** 3/mol')
         
         osmotic_pressure = -1 * unit.R * self.get_temperature() / partial_molar_volume_water * math.log (self.get_water_activity())
-        logger.info('Computed osmotic pressure of solution as %s Pa at T= %s degrees C' % (osmotic_pressure,self.get_temperature()))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Computed osmotic pressure of solution as %s Pa at T= %s degrees C', osmotic_pressure,self.get_temperature())
         return osmotic_pressure.to('Pa')
 
 ## Concentration  Methods        
@@ -686,15 +785,17 @@ class Solution:
         
         Parameters
         ----------
-        solute : str
-            String representing the formula of the solute
+        solute : str or list of str
+            String representing the formula of the solute. If a list of
+            solutes is given, p is calculated for all of them at once and
+            returned as an array.
         activity: bool, optional
             If False, the function will use the molar concentration rather 
             than the activity to calculate p. Defaults to True.
         
         Returns
         -------
-        Quantity
+        Quantity or numpy.ndarray
             The negative log10 of the activity (or molar concentration if
             activity = False) of the solute.
             
@@ -703,15 +804,27 @@ class Solution:
         TODO
         
         '''
+        # evaluate the log for all of the solutes at once if a list is given
+        if not isinstance(solute,str):
+            if activity is True:
+                values = np.array([self.get_activity(item).magnitude for item in solute],dtype=float)
+            else:
+                values = np.array([self.get_amount(item,'mol/L').magnitude for item in solute],dtype=float)
+            # solutes with zero concentration return 0, as in the scalar case
+            output = np.zeros(len(values))
+            nonzero = values > 0
+            output[nonzero] = -np.log10(values[nonzero])
+            return output
+        
         try:
             if activity is True:
-                return -1 * math.log10(self.get_activity(solute))
+                return -math.log10(self.get_activity(solute))
             elif activity is False:
-                return -1 * math.log10(self.get_amount(solute,'mol/L').magnitude)
+                return -math.log10(self.get_amount(solute,'mol/L').magnitude)
         # if the solute has zero concentration, the log will generate a ValueError
         except ValueError:
             return 0
-            
+
     def get_amount(self,solute,units):
         '''
         Return the amount of 'solute' in the parent solution.
@@ -752,8 +865,9 @@ class Solution:
         '''
         # retrieve the number of moles of solute and its molecular weight
         try:
-            moles = self.get_solute(solute).get_moles()
-            mw = self.get_solute(solute).get_molecular_weight()
+            component = self.components[solute]
+            moles = component.moles
+            mw = component.mw
         # if the solute is not present in the solution, we'll get a KeyError
         # In that case, the amount is zero
         except KeyError:
@@ -763,25 +877,57 @@ class Solution:
                 logger.error('Unsupported unit specified for get_amount')
                 return 0
             
-        # with pint unit conversions enabled, we just pass the unit to pint
-        # the logic tests here ensure that only the required arguments are 
-        # passed to pint for the unit conversion. This avoids unecessary 
-        # function calls.
         if units == 'fraction':
             return moles / (self.get_moles_solvent() + self.get_total_moles_solute() )
         elif units == '%':
-            return moles.to('kg','chem',mw=mw) / self.get_mass().to('kg') * 100
-        elif unit(units).dimensionality in ('[substance]/[length]**3','[mass]/[length]**3'):
-            return moles.to(units,'chem',mw=mw,volume=self.get_volume())
-        elif unit(units).dimensionality in ('[substance]/[mass]','[mass]/[mass]'):
-            return moles.to(units,'chem',mw=mw,solvent_mass=self.get_solvent_mass())
-        elif unit(units).dimensionality == '[mass]':
-            return moles.to(units,'chem',mw=mw)
-        elif unit(units).dimensionality == '[substance]':
-            return moles.to(units)
-        else:
+            mass = moles.m_as('mol') * mw.m_as('g/mol') / _G_PER_KG
+            return unit.Quantity(mass / self.get_mass().to('kg').magnitude * 100,'dimensionless')
+        
+        # look up the conversion for this kind of unit. The arithmetic is done on
+        # magnitudes, which is much faster than a pint conversion in the 'chem' context
+        amount_conversion = _amount_conversion(units)
+        if amount_conversion is None:
             logger.error('Unsupported unit specified for get_amount')
             return None
+        
+        conversion, factor = amount_conversion
+        return unit.Quantity(conversion(self,moles.m_as('mol'),mw.m_as('g/mol')) * factor,units)
+
+    def get_amounts_array(self,units):
+        '''
+        Return the amounts of all the components in the solution as an array.
+        
+        Parameters
+        ----------
+        units : str
+                Units desired for the output. See get_amount() for valid units.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Magnitudes of the amounts of each component, in the specified units. The
+            order of the array is the same as the order of self.components
+        
+        See Also
+        --------
+        get_amount
+        '''
+        moles, mw, charge = self._get_component_arrays()
+        
+        if units == 'fraction':
+            return moles / moles.sum()
+        elif units == '%':
+            mass = moles * mw
+            return mass / mass.sum() * 100
+        
+        # convert every component at once
+        amount_conversion = _amount_conversion(units)
+        if amount_conversion is None:
+            logger.error('Unsupported unit specified for get_amounts_array')
+            return None
+        
+        conversion, factor = amount_conversion
+        return conversion(self,moles,mw) * factor
 
     def get_total_amount(self,element,units):
         '''
@@ -809,24 +955,22 @@ class Solution:
         --------
         get_amount
         '''
-        import pyEQL.chemical_formula as ch
-        
         TOT = 0 * unit(units)
         
         # loop through all the solutes, process each one containing element
         for item in self.components:
             # check whether the solute contains the element
-            if ch.contains(item,element):
+            if chem.contains(item,element):
                 # start with the amount of the solute in the desired units
                 amt = self.get_amount(item,units)
 
                 # convert the solute amount into the amount of element by
                 # either the mole / mole or weight ratio
                 if unit(units).dimensionality in ('[substance]','[substance]/[length]**3','[substance]/[mass]'):
-                    TOT += amt * ch.get_element_mole_ratio(item,element)
+                    TOT += amt * chem.get_element_mole_ratio(item,element)
 
                 elif unit(units).dimensionality in ('[mass]','[mass]/[length]**3','[mass]/[mass]'):
-                    TOT += amt * ch.get_element_weight_fraction(item,element)
+                    TOT += amt * chem.get_element_weight_fraction(item,element)
             
         return TOT
 
@@ -859,7 +1003,7 @@ class Solution:
         # if units are given on a per-volume basis, 
         # iteratively solve for the amount of solute that will preserve the
         # original volume and result in the desired concentration  
-        if unit(amount).dimensionality in ('[substance]/[length]**3','[mass]/[length]**3'):
+        if unit(amount).dimensionality in _PER_VOLUME_DIMENSIONALITY:
             
             # store the original volume for later
             orig_volume = self.get_volume()
@@ -870,7 +1014,7 @@ class Solution:
             # set the amount to zero and log a warning if the desired amount
             # change would result in a negative concentration
             if self.get_amount(solute,'mol').magnitude < 0:
-                logger.warning('Attempted to set a negative concentration for solute %s. Concentration set to 0' % solute)
+                logger.warning('Attempted to set a negative concentration for solute %s. Concentration set to 0', solute)
                 self.set_amount(solute,'0 mol')
             
             # calculate the volume occupied by all the solutes
@@ -881,7 +1025,7 @@ class Solution:
             
             # adjust the amount of solvent
             target_mass = target_vol * h2o.water_density(self.get_temperature())
-            mw = self.get_solvent().get_molecular_weight()
+            mw = self.get_solvent().mw
             target_mol = target_mass / mw
             self.get_solvent().moles = target_mol
             
@@ -893,7 +1037,7 @@ class Solution:
             # set the amount to zero and log a warning if the desired amount
             # change would result in a negative concentration
             if self.get_amount(solute,'mol').magnitude < 0:
-                logger.warning('Attempted to set a negative concentration for solute %s. Concentration set to 0' % solute)
+                logger.warning('Attempted to set a negative concentration for solute %s. Concentration set to 0', solute)
                 self.set_amount(solute,'0 mol')
             
             # update the volume to account for the space occupied by all the solutes
@@ -935,14 +1079,17 @@ class Solution:
         --------
         Solute.set_moles()
         '''
+        # parse the amount only once
+        quantity = unit(amount)
+        
         # raise an error if a negative amount is specified
-        if unit(amount).magnitude < 0:
-            logger.error('Negative amount specified for solute %s. Concentration not changed.' % solute)
+        if quantity.magnitude < 0:
+            logger.error('Negative amount specified for solute %s. Concentration not changed.', solute)
         
         # if units are given on a per-volume basis, 
         # iteratively solve for the amount of solute that will preserve the
         # original volume and result in the desired concentration  
-        elif unit(amount).dimensionality in ('[substance]/[length]**3','[mass]/[length]**3'):
+        elif quantity.dimensionality in _PER_VOLUME_DIMENSIONALITY:
             
             # store the original volume for later
             orig_volume = self.get_volume()
@@ -958,7 +1105,7 @@ class Solution:
             
             # adjust the amount of solvent
             target_mass = target_vol * h2o.water_density(self.get_temperature())
-            mw = self.get_solvent().get_molecular_weight()
+            mw = self.get_solvent().mw
             target_mol = target_mass / mw
             self.get_solvent().moles = target_mol
             
@@ -1011,11 +1158,11 @@ class Solution:
         
     def get_total_moles_solute(self):
         '''Return the total moles of all solute in the solution'''
-        tot_mol = 0
-        for item in self.components:
-            if item != self.solvent_name:
-                tot_mol += self.components[item].get_moles()
-        return tot_mol
+        if 'total_moles_solute' not in self._aggregates:
+            moles, mw, charge = self._get_component_arrays()
+            self._aggregates['total_moles_solute'] = float(moles[self._solute_mask].sum())
+        
+        return unit.Quantity(self._aggregates['total_moles_solute'],'mol')
     
     def get_mole_fraction(self,solute):
         '''
@@ -1043,8 +1190,10 @@ class Solution:
             The moles of solvent in the solution.
         
         '''
+        if 'moles_solvent' not in self._aggregates:
+            self._aggregates['moles_solvent'] = self.get_amount(self.solvent_name,'mol').magnitude
         
-        return self.get_amount(self.solvent_name,'mol')
+        return unit.Quantity(self._aggregates['moles_solvent'],'mol')
     
     def get_salt(self):
         '''
@@ -1102,7 +1251,6 @@ class Solution:
         2
         '''
         # identify the predominant salt in the solution
-        import pyEQL.salt_ion_match as salt
         return salt.identify_salt(self)
 
     def get_salt_list(self):
@@ -1129,7 +1277,9 @@ class Solution:
         Returns
         -------
         dict
-            A dictionary of Salt objects, keyed to the salt formula
+            A dictionary of Salt objects, keyed to the salt formula. The dictionary
+            is cached until the composition of the solution changes, so it should
+            not be modified.
 
         See Also
         --------
@@ -1142,8 +1292,10 @@ class Solution:
 
         '''
         # identify the predominant salt in the solution
-        import pyEQL.salt_ion_match as salt
-        return salt.generate_salt_list(self,unit='mol/kg')
+        if 'salt_list' not in self._aggregates:
+            self._aggregates['salt_list'] = salt.generate_salt_list(self,unit='mol/kg')
+        
+        return self._aggregates['salt_list']
 
 ## Activity-related methods
     def get_activity_coefficient(self,solute,scale='molal',verbose=False):
@@ -1232,20 +1384,19 @@ class Solution:
         else:
             
             # identify the predominant salt that this ion is a member of
-            Salt = None
-            salt_list = pyEQL.salt_ion_match.generate_salt_list(self,unit='mol/kg')
-            for item in salt_list:
-                if solute == item.cation or solute == item.anion:
-                        Salt = item       
+            Salt = self._get_parent_salt(solute)
             
             # show an error if no salt can be found that contains the solute
             if Salt is None:
-                logger.warning('No salts found that contain solute %s. Returning unit activity coefficient.' % solute)
+                logger.warning('No salts found that contain solute %s. Returning unit activity coefficient.', solute)
                 return unit('1 dimensionless')
 
             # search the database for pitzer parameters for 'Salt'
             db.search_parameters(Salt.formula)
 
+            # the ionic strength is needed by every activity model below
+            ionic_strength = self.get_ionic_strength()
+
             # use the Pitzer model for higher ionic strength, if the parameters are available
 
             # search for Pitzer parameters
@@ -1276,47 +1427,74 @@ class Solution:
                 #molality = (self.get_amount(Salt.cation,'mol/kg')/Salt.nu_cation+self.get_amount(Salt.anion,'mol/kg')/Salt.nu_anion)/2
 
                 # determine the effective molality of the salt in the solution
-                molality = Salt.get_effective_molality(self.get_ionic_strength())
+                molality = Salt.get_effective_molality(ionic_strength)
+
+                # retrieve the parameter values once, rather than once per coefficient
+                param_values = param.get_value()
 
-                activity_coefficient=ac.get_activity_coefficient_pitzer(self.get_ionic_strength(), \
-                molality,alpha1,alpha2,param.get_value()[0],param.get_value()[1],param.get_value()[2],param.get_value()[3], \
+                activity_coefficient=ac.get_activity_coefficient_pitzer(ionic_strength, \
+                molality,alpha1,alpha2,param_values[0],param_values[1],param_values[2],param_values[3], \
                 Salt.z_cation,Salt.z_anion,Salt.nu_cation,Salt.nu_anion,temperature)
 
-                logger.info('Calculated activity coefficient of species %s as %s based on salt %s using Pitzer model' % (solute,activity_coefficient,Salt))
+                logger.info('Calculated activity coefficient of species %s as %s based on salt %s using Pitzer model', solute,activity_coefficient,Salt)
                 molal= activity_coefficient
 
-            # for very low ionic strength, use the Debye-Huckel limiting law
-            elif self.get_ionic_strength().magnitude <= 0.005:
-                logger.info('Ionic strength = %s. Using Debye-Huckel to calculate activity coefficient.' % self.get_ionic_strength())
-                molal= ac.get_activity_coefficient_debyehuckel(self.get_ionic_strength(),ion.get_formal_charge(),temperature)
-
-            # use the Guntelberg approximation for 0.005 < I < 0.1
-            elif self.get_ionic_strength().magnitude <= 0.1:
-                logger.info('Ionic strength = %s. Using Guntelberg to calculate activity coefficient.' % self.get_ionic_strength())
-                molal= ac.get_activity_coefficient_guntelberg(self.get_ionic_strength(),ion.get_formal_charge(),temperature)
-
-            # use the Davies equation for 0.1 < I < 0.5
-            elif self.get_ionic_strength().magnitude <= 0.5:
-                logger.info('Ionic strength = %s. Using Davies equation to calculate activity coefficient.' % self.get_ionic_strength())
-                molal= ac.get_activity_coefficient_davies(self.get_ionic_strength(),ion.get_formal_charge(),temperature)
-
             else:
-                logger.warning('Ionic strength too high to estimate activity for species %s. Specify parameters for Pitzer model. Returning unit activity coefficient' % solute)
+                # choose the first model whose upper limit of ionic strength is not exceeded:
+                # Debye-Huckel for I <= 0.005, Guntelberg for I <= 0.1, Davies for I <= 0.5
+                model = bisect.bisect_left(_ACTIVITY_MODEL_LIMITS,ionic_strength.magnitude)
+                
+                if model < len(_ACTIVITY_MODELS):
+                    name, activity_function = _ACTIVITY_MODELS[model]
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info('Ionic strength = %s. Using %s to calculate activity coefficient.', ionic_strength,name)
+                    molal= activity_function(ionic_strength,ion.charge,temperature)
+                    
+                else:
+                    logger.warning('Ionic strength too high to estimate activity for species %s. Specify parameters for Pitzer model. Returning unit activity coefficient', solute)
 
-                molal= unit('1 dimensionless')
+                    molal= unit('1 dimensionless')
 
             # if necessary, convert the activity coefficient to another scale, and return the result
             if scale == 'molal':
                 return molal
-            elif scale == 'molar':
-                total_molality = self.get_total_moles_solute()/self.get_solvent_mass()
-                total_molarity = self.get_total_moles_solute() / self.get_volume()
-                return (molal * h2o.water_density(self.get_temperature()) * total_molality / total_molarity).to('dimensionless')
-            elif scale == 'rational':
-                return molal*(1+unit('0.018 kg/mol')*self.get_total_moles_solute()/self.get_solvent_mass())
-            else:
+            
+            factor = self._get_activity_scale_factor(scale)
+            if factor is None:
                 logger.warning('Invalid scale argument. Returning molal-scale activity coefficient')
                 return molal
+            
+            return molal * factor
+
+    def _get_parent_salt(self,solute):
+        '''
+        Return the Salt object from get_salt_list() that contains 'solute', or None
+        if no salt contains it.
+        '''
+        Salt = None
+        for item in self.get_salt_list():
+            if solute == item.cation or solute == item.anion:
+                Salt = item
+        
+        return Salt
+    
+    def _get_activity_scale_factor(self,scale):
+        '''
+        Return the dimensionless factor that converts molal scale activity coefficients
+        to 'scale' ('molal', 'molar', or 'rational'), or None if 'scale' is not valid.
+        
+        The factor depends only on the solution, not on the solute.
+        '''
+        if scale == 'molal':
+            return unit.Quantity(1,'dimensionless')
+        elif scale == 'molar':
+            total_molality = self.get_total_moles_solute()/self.get_solvent_mass()
+            total_molarity = self.get_total_moles_solute() / self.get_volume()
+            return (h2o.water_density(self.get_temperature()) * total_molality / total_molarity).to('dimensionless')
+        elif scale == 'rational':
+            return 1+unit('0.018 kg/mol')*self.get_total_moles_solute()/self.get_solvent_mass()
+        else:
+            return None
 
     def get_activity(self,solute,scale='molal',verbose=False):
         '''
@@ -1374,10 +1552,78 @@ class Solution:
                 scale = 'molal'
             
             activity = self.get_activity_coefficient(solute,scale=scale,verbose=verbose) * self.get_amount(solute,unit).magnitude
-            logger.info('Calculated %s scale activity of solute %s as %s' % (scale,solute,activity))
+            logger.info('Calculated %s scale activity of solute %s as %s', scale,solute,activity)
         
         return activity
 
+    def get_activities_array(self,scale='molal'):
+        '''
+        Return the activities of all the components in the solution as an array.
+        
+        Parameters
+        ----------
+        scale : str
+            The concentration scale for the returned activities. See get_activity()
+        
+        Returns
+        -------
+        numpy.ndarray
+            The (dimensionless) activity of each component. The order of the array
+            is the same as the order of self.components
+            
+        See Also
+        --------
+        get_activity
+        '''
+        # determine the concentration units to use based on the desired scale
+        if scale == 'molal':
+            units = 'mol/kg'
+        elif scale == 'molar':
+            units = 'mol/L'
+        elif scale == 'rational':
+            units = 'fraction'
+        else:
+            logger.error('Invalid scale argument. Returning molal-scale activities.')
+            units = 'mol/kg'
+            scale = 'molal'
+        
+        # convert the amounts of all the components at once, so that only the
+        # activity coefficients are evaluated for each solute
+        concentration = self.get_amounts_array(units)
+        moles, mw, charge = self._get_component_arrays()
+        activities = np.empty(len(concentration))
+        
+        # ions whose parent salt has no Pitzer parameters all use the same Debye-Huckel
+        # type equation, so their activity coefficients are evaluated together below
+        debyehuckel_index = []
+        
+        for i, item in enumerate(self.components):
+            if item == 'H2O' or item == 'water':
+                activities[i] = self.get_water_activity().magnitude
+                continue
+            
+            Salt = self._get_parent_salt(item)
+            if Salt is not None and concentration[i] != 0:
+                db.search_parameters(Salt.formula)
+                if not db.has_parameter(Salt.formula,'pitzer_parameters_activity'):
+                    debyehuckel_index.append(i)
+                    continue
+            
+            activities[i] = (self.get_activity_coefficient(item,scale=scale) * concentration[i]).magnitude
+        
+        if debyehuckel_index:
+            ionic_strength = self.get_ionic_strength().magnitude
+            if ionic_strength > ac.DAVIES_LIMIT:
+                for i in debyehuckel_index:
+                    logger.warning('Ionic strength too high to estimate activity for species %s. Specify parameters for Pitzer model. Returning unit activity coefficient', self._component_keys[i])
+            
+            A = ac._debye_parameter_activity_cached(str(self.get_temperature()))
+            gamma = ac._debyehuckel_family_gamma(A,charge[debyehuckel_index],ionic_strength)
+            factor = self._get_activity_scale_factor(scale).to('dimensionless').magnitude
+            activities[debyehuckel_index] = gamma * factor * concentration[debyehuckel_index]
+        
+        return activities
+
     def get_osmotic_coefficient(self, scale='molal'):
         '''
         Return the osmotic coefficient of an aqueous solution.
@@ -1452,8 +1698,8 @@ class Solution:
         <Quantity(0.9235996615888572, 'dimensionless')>
         
         >>> s1 = pyEQL.Solution([['Mg+2','0.3 mol/kg'],['Cl-','0.6 mol/kg']],temperature='30 degC')
-        >>> s1.get_osmotic_coefficient()
-        <Quantity(0.891154788474231, 'dimensionless')>
+        >>> s1.get_osmotic_coefficient() #doctest: +ELLIPSIS
+        <Quantity(0.89115478847423..., 'dimensionless')>
         
         '''
         temperature = str(self.get_temperature())
@@ -1462,8 +1708,6 @@ class Solution:
         effective_osmotic_sum = 0
         molality_sum = 0
 
-        import pyEQL.salt_ion_match as salt
-
         # organize the composition into a dictionary of salts
         salt_list = self.get_salt_list()
 
@@ -1506,16 +1750,17 @@ class Solution:
             if db.has_parameter(item.formula,'pitzer_parameters_activity'):
 
                 param = db.get_parameter(item.formula,'pitzer_parameters_activity')
+                param_values = param.get_value()
 
                 osmotic_coefficient=ac.get_osmotic_coefficient_pitzer(ionic_strength, \
-                concentration,alpha1,alpha2,param.get_value()[0],param.get_value()[1],param.get_value()[2],param.get_value()[3], \
+                concentration,alpha1,alpha2,param_values[0],param_values[1],param_values[2],param_values[3], \
                 item.z_cation,item.z_anion,item.nu_cation,item.nu_anion,temperature)
 
-                logger.info('Calculated osmotic coefficient of water as %s based on salt %s using Pitzer model' % (osmotic_coefficient,item.formula))
+                logger.info('Calculated osmotic coefficient of water as %s based on salt %s using Pitzer model', osmotic_coefficient,item.formula)
                 effective_osmotic_sum += concentration * osmotic_coefficient
 
             else:
-                logger.warning('Cannot calculate osmotic coefficient because Pitzer parameters for salt %s are not specified. Returning unit osmotic coefficient' % item.formula)
+                logger.warning('Cannot calculate osmotic coefficient because Pitzer parameters for salt %s are not specified. Returning unit osmotic coefficient', item.formula)
                 effective_osmotic_sum += concentration * unit('1 dimensionless')
 
         molal_phi= effective_osmotic_sum / molality_sum
@@ -1586,16 +1831,14 @@ class Solution:
             logger.warning('Pitzer parameters not found. Water activity set equal to mole fraction')
             return self.get_amount('H2O','fraction')
         else:
-            concentration_sum = unit('0 mol/kg')
-            for item in self.components:                
-                if item == 'H2O':
-                    pass
-                else:
-                    concentration_sum += self.get_amount(item,'mol/kg')
+            # total molality of all the solutes, summed over the component array
+            concentration_sum = self.get_total_moles_solute() / self.get_solvent_mass()
                     
             logger.info('Calculated water activity using osmotic coefficient')  
             
-            return math.exp(- osmotic_coefficient * 0.018015*unit('kg/mol') * concentration_sum) * unit('1 dimensionless')
+            exponent = (osmotic_coefficient * 0.018015*unit('kg/mol') * concentration_sum).to('dimensionless').magnitude
+            
+            return np.exp(- exponent) * unit('1 dimensionless')
     
     def get_ionic_strength(self):
         '''
@@ -1632,9 +1875,12 @@ class Solution:
         >>> s1.get_ionic_strength()
         <Quantity(1.0000001004383303, 'mole / kilogram')>
         '''
-        self.ionic_strength=0
-        for solute in self.components.keys():
-            self.ionic_strength += 0.5 * self.get_amount(solute,'mol/kg') * self.components[solute].get_formal_charge() ** 2
+        if 'ionic_strength' not in self._aggregates:
+            moles, mw, charge = self._get_component_arrays()
+            solvent_mass = self.get_solvent_mass().to('kg').magnitude
+            self._aggregates['ionic_strength'] = 0.5 * float(np.dot(moles,self._charge_squared)) / solvent_mass
+        
+        self.ionic_strength = unit.Quantity(self._aggregates['ionic_strength'],'mol/kg')
        
         return self.ionic_strength
     
@@ -1660,9 +1906,8 @@ class Solution:
         Where :math:`n_i` is the number of moles, :math:`z_i` is the charge on species i, and :math:`F` is the Faraday constant.
 
         '''
-        self.charge_balance=0
-        for solute in self.components.keys():
-            self.charge_balance += self.get_amount(solute,'mol') * self.components[solute].get_formal_charge() * unit.e * unit.N_A
+        moles, mw, charge = self._get_component_arrays()
+        self.charge_balance = float(np.dot(moles,charge)) * unit('mol') * unit.e * unit.N_A
 
         return self.charge_balance.magnitude
 
@@ -1679,10 +1924,10 @@ class Solution:
         -----
         The alkalinity is calculated according to: [#]_
 
-        .. math:: Alk = F \sum_i z_i C_B - \sum_i z_i C_A
+        .. math:: Alk = F \sum_i |z_i| C_B - \sum_i |z_i| C_A
 
         Where :math:`C_B` and :math:`C_A` are conservative cations and anions, respectively 
-        (i.e. ions that do not participate in acid-base reactions), and :math:`z_i` is their charge.
+        (i.e. ions that do not participate in acid-base reactions), and :math:`|z_i|` is the magnitude of their charge.
         In this method, the set of conservative cations is all Group I and Group II cations, and the conservative anions
         are all the anions of strong acids.
 
@@ -1691,19 +1936,17 @@ class Solution:
         .. [#] Stumm, Werner and Morgan, James J. Aquatic Chemistry, 3rd ed, 
                pp 165. Wiley Interscience, 1996.
         '''
-        alkalinity = 0 * unit('mol/L')
         equiv_wt_CaCO3 = 100.09 / 2 * unit('g/mol')
         
         base_cations=['Li+','Na+','K+','Rb+','Cs+','Fr+','Be+2','Mg+2','Ca+2','Sr+2','Ba+2','Ra+2']
         acid_anions=['Cl-','Br-','I-','SO4-2','NO3-','ClO4-','ClO3-']
         
-        for item in self.components:
-            if item in base_cations:
-                z = self.get_solute(item).get_formal_charge()
-                alkalinity += self.get_amount(item,'mol/L') * z
-            if item in acid_anions:
-                z = self.get_solute(item).get_formal_charge()
-                alkalinity -= self.get_amount(item,'mol/L') * z 
+        # add the charge equivalents of the base cations and subtract those
+        # of the acid anions, for all components at once
+        concentration = self.get_amounts_array('mol/L')
+        charge = self._get_component_arrays()[2]
+        sign = np.array([1 if item in base_cations else -1 if item in acid_anions else 0 for item in self._component_keys],dtype=float)
+        alkalinity = float(np.dot(sign * np.abs(charge),concentration)) * unit('mol/L')
         
         # convert the alkalinity to mg/L as CaCO3
         return (alkalinity*equiv_wt_CaCO3).to('mg/L')
@@ -1728,13 +1971,13 @@ class Solution:
             The hardness of the solution in mg/L as CaCO3
         
         '''
-        hardness = 0 * unit('mol/L')
         equiv_wt_CaCO3 = 100.09 / 2 * unit('g/mol')
         
-        for item in self.components:
-            z = self.get_solute(item).get_formal_charge()
-            if z > 1:
-                hardness += z * self.get_amount(item,'mol/L')
+        # sum the equivalent concentrations of the multivalent cations
+        concentration = self.get_amounts_array('mol/L')
+        charge = self._get_component_arrays()[2]
+        multivalent = charge > 1
+        hardness = float(np.dot(charge[multivalent],concentration[multivalent])) * unit('mol/L')
         
         # convert the hardness to mg/L as CaCO3
         return (hardness*equiv_wt_CaCO3).to('mg/L')
@@ -1773,15 +2016,15 @@ class Solution:
         get_dielectric_constant()
         
         '''
-        temperature = self.get_temperature()
+        temperature = self.get_temperature().magnitude
         
-        # to preserve dimensionality, convert the ionic strength into mol/L units
-        ionic_strength= self.get_ionic_strength().magnitude*unit('mol/L')
-        dielectric_constant = self.get_dielectric_constant()
+        # the molal ionic strength is used as a molar (mol/L) concentration
+        ionic_strength = self.get_ionic_strength().magnitude
+        dielectric_constant = float(self.get_dielectric_constant())
         
-        debye_length = (dielectric_constant * unit.epsilon_0 * unit.k * temperature / (2 * unit.N_A * unit.e ** 2 * ionic_strength)) ** 0.5
+        debye_length = math.sqrt(_DEBYE_LENGTH_PREFACTOR * dielectric_constant * temperature / ionic_strength)
         
-        return debye_length.to('nm')
+        return debye_length * unit('nm')
 
     def get_bjerrum_length(self):
         '''
@@ -1823,12 +2066,11 @@ class Solution:
         get_dielectric_constant()
         
         '''
-        temperature = self.get_temperature()
-        dielectric_constant = self.get_dielectric_constant()
+        temperature = self.get_temperature().magnitude
+        dielectric_constant = float(self.get_dielectric_constant())
         
-        bjerrum_length = unit.e ** 2 / (4 * math.pi * dielectric_constant * unit.epsilon_0 * unit.k
-         * temperature)
-        return bjerrum_length.to('nm')
+        bjerrum_length = _BJERRUM_LENGTH_PREFACTOR / (dielectric_constant * temperature)
+        return bjerrum_length * unit('nm')
         
     def get_transport_number(self,solute,activity_correction = False):
         '''Calculate the transport number of the solute in the solution
@@ -1877,7 +2119,7 @@ class Solution:
         
         for item in self.components:
 
-            z = self.get_solute(item).get_formal_charge()
+            z = self.components[item].charge
             term = self.get_property(item,'diffusion_coefficient') * \
             z ** 2 * self.get_amount(item,'mol/L')
             
@@ -1943,9 +2185,11 @@ class Solution:
         
         D = self.get_property(solute,'diffusion_coefficient')
         
-        molar_cond = D * (unit.e * unit.N_A) ** 2 * self.get_solute(solute).get_formal_charge() ** 2 / (unit.R * temperature)
+        F2_RT = _faraday_squared_over_RT(temperature.to('K').magnitude)
+        
+        molar_cond = _nernst_einstein(self.components[solute].charge,D.to('m**2/s').magnitude,F2_RT) * unit('S * m**2 / mol')
         
-        logger.info('Computed molar conductivity as %s from D = %s at T=%s' % (molar_cond,str(D),temperature))
+        logger.info('Computed molar conductivity as %s from D = %s at T=%s', molar_cond,D,temperature)
         
         return molar_cond.to('mS / cm / (mol/L)')
             
@@ -1982,11 +2226,14 @@ class Solution:
         
         D = self.get_property(solute,'diffusion_coefficient')
         
-        mobility = unit.N_A * unit.e * abs(self.get_solute(solute).get_formal_charge()) * D / (unit.R * temperature)
+        # F / (R T) = (F^2 / (R T)) / F
+        F_RT = _faraday_squared_over_RT(temperature.to('K').magnitude) / _FARADAY_CONSTANT
+        
+        mobility = abs(self.components[solute].charge) * D.to('m**2/s').magnitude * F_RT * unit('m**2/V/s')
         
-        logger.info('Computed ionic mobility as %s from D = %s at T=%s' % (mobility,str(D),temperature))
+        logger.info('Computed ionic mobility as %s from D = %s at T=%s', mobility,D,temperature)
         
-        return mobility.to('m**2/V/s')
+        return mobility
         
     def get_property(self,solute,name):
         '''Retrieve a thermodynamic property (such as diffusion coefficient)
@@ -2027,7 +2274,7 @@ class Solution:
                 # assume that the base viscosity is that of pure water
                 return base_value * self.get_temperature() / base_temperature * h2o.water_viscosity_dynamic(base_temperature,base_pressure) / self.get_viscosity_dynamic()
             else:
-                logger.warning('Diffusion coefficient not found for species %s. Assuming zero.' % (solute))
+                logger.warning('Diffusion coefficient not found for species %s. Assuming zero.', solute)
                 return unit('0 m**2/s')
             
         # just return the base-value molar volume for now; find a way to adjust for
@@ -2035,20 +2282,20 @@ class Solution:
         if name == 'partial_molar_volume':
             # calculate the partial molar volume for water since it isn't in the database            
             if solute == 'H2O':
-                vol = self.get_solute('H2O').get_molecular_weight() / h2o.water_density(self.get_temperature())
+                vol = self.components['H2O'].mw / h2o.water_density(self.get_temperature())
                 return vol.to('cm **3 / mol')
             else:
                 if base_value is not None:
-                    return base_value
                     if self.get_temperature() != base_temperature:
-                        logger.warning('Partial molar volume for species %s not corrected for temperature' % solute)
+                        logger.warning('Partial molar volume for species %s not corrected for temperature', solute)
+                    return base_value
                 else:
-                    logger.warning('Partial molar volume not found for species %s. Assuming zero.' % solute)
+                    logger.warning('Partial molar volume not found for species %s. Assuming zero.', solute)
                     return unit ('0 cm **3 / mol')
         
         # for parameters not named above, just return the base value
         else:
-            logger.warning('%s has not been corrected for solution conditions' % name)
+            logger.warning('%s has not been corrected for solution conditions', name)
             return base_value
                 
     def get_chemical_potential_energy(self,activity_correction=True):
@@ -2150,6 +2397,86 @@ class Solution:
         
         return distance.to('nm')
     
+    def _get_component_arrays(self):
+        '''
+        Return the moles, molecular weight, and formal charge of every component as parallel arrays.
+        
+        The molecular weight and charge of a component never change, so those arrays (and
+        the squared charges used by get_ionic_strength, and the mask self._solute_mask
+        that is False for the solvent and True for every solute) are cached and only
+        rebuilt when components are added to the solution. Moles are read from the
+        Solute objects on every call.
+        
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The moles (mol), molecular weight (g/mol), and formal charge of each component,
+            in the same order as self.components
+        '''
+        keys = tuple(self.components)
+        solutes = self.components.values()
+        if keys != self._component_keys:
+            self._mw = np.array([item.mw.m_as('g/mol') for item in solutes],dtype=float)
+            self._charge = np.array([item.charge for item in solutes],dtype=float)
+            self._charge_squared = self._charge ** 2
+            self._solute_mask = np.array([item != self.solvent_name for item in keys],dtype=bool)
+            self._component_keys = keys
+        
+        moles = np.fromiter((item.moles.m_as('mol') for item in solutes),dtype=float,count=len(keys))
+        
+        return moles, self._mw, self._charge
+
+    def __getstate__(self):
+        '''
+        Return the state of the solution for pickling and copying
+        
+        The cached composition-dependent properties and per-component arrays
+        are omitted; they are rebuilt when next needed.
+        '''
+        state = self.__dict__.copy()
+        state['_aggregates'] = {}
+        state['_component_keys'] = ()
+        state['_mw'] = np.zeros(0)
+        state['_charge'] = np.zeros(0)
+        state['_charge_squared'] = np.zeros(0)
+        state['_solute_mask'] = np.zeros(0,dtype=bool)
+        return state
+    
+    def __setstate__(self,state):
+        self.__dict__.update(state)
+        
+        # point the components at this solution rather than the original
+        for solute in self.components.values():
+            solute._parent = weakref.ref(self)
+    
+    def __deepcopy__(self,memo):
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.__setstate__(copy.deepcopy(self.__getstate__(),memo))
+        return new
+    
+    def _register_component(self,solute):
+        '''
+        Add a Solute object to the components of the solution
+        
+        The solute keeps a weak reference to this solution so that changing
+        its amount clears the cached composition-dependent properties.
+        '''
+        solute._parent = weakref.ref(self)
+        self.components[solute.formula] = solute
+        self._invalidate_aggregates()
+    
+    def _invalidate_aggregates(self):
+        '''
+        Discard the cached properties that depend on the solution composition
+        
+        Called whenever a component is added or the amount of any component changes.
+        Quantities are cached as plain magnitudes, and the methods that read them
+        return a new Quantity each time, so that a caller that converts the result
+        in place (e.g. with ito()) does not change the cached value.
+        '''
+        self._aggregates.clear()
+
     def _update_volume(self):
         '''
         Recalculate the solution volume based on composition
@@ -2210,16 +2537,18 @@ class Solution:
                 alpha1 = 2
                 alpha2 = 0
                 
+            param_values = param.get_value()
+            
             apparent_vol = ac.get_apparent_volume_pitzer(self.get_ionic_strength(), \
-            molality,alpha1,alpha2,param.get_value()[0],param.get_value()[1],param.get_value()[2],param.get_value()[3], \
-            param.get_value()[4],Salt.z_cation,Salt.z_anion,Salt.nu_cation,Salt.nu_anion,temperature)
+            molality,alpha1,alpha2,param_values[0],param_values[1],param_values[2],param_values[3], \
+            param_values[4],Salt.z_cation,Salt.z_anion,Salt.nu_cation,Salt.nu_anion,temperature)
             
             solute_vol += apparent_vol * (self.get_amount(Salt.cation,'mol')/Salt.nu_cation \
             +self.get_amount(Salt.anion,'mol')/Salt.nu_anion)/2
             
             pitzer_calc = True
             
-            logger.info('Updated solution volume using Pitzer model for solute %s' % Salt.formula)
+            logger.info('Updated solution volume using Pitzer model for solute %s', Salt.formula)
             
         # add the partial molar volume of any other solutes, except for water
         # or the parent salt, which is already accounted for by the Pitzer parameters
@@ -2236,11 +2565,11 @@ class Solution:
                 continue                
             
             if db.has_parameter(item,'partial_molar_volume'):
-                solute_vol += solute.get_parameter('partial_molar_volume') * solute.get_moles()
-                logger.info('Updated solution volume using direct partial molar volume for solute %s' % item)
+                solute_vol += solute.get_parameter('partial_molar_volume') * solute.moles
+                logger.info('Updated solution volume using direct partial molar volume for solute %s', item)
                 
             else:
-                logger.warning('Partial molar volume data not available for solute %s. Solution volume will not be corrected.' % item)
+                logger.warning('Partial molar volume data not available for solute %s. Solution volume will not be corrected.', item)
                 
         return solute_vol.to('L')
             
@@ -2298,31 +2627,35 @@ class Solution:
             
         '''
         result_list=[]
-        # populate a list with component names
+        
+        # convert the amounts of all the components at once
+        amounts = self.get_amounts_array(unit)
+        if unit == 'fraction' or unit == '%':
+            amount_units = 'dimensionless'
+        else:
+            amount_units = unit
+        moles, mw, charge = self._get_component_arrays()
 
+        # select the components to list and the heading to print
         if type == 'all':
-            print('Component Concentrations:\n')
-            print('========================\n')
-            for item in self.components:
-                amount=self.get_amount(item,unit)
-                result_list.append([item,amount])
-                print(item+':'+'\t {0:0.{decimals}f~}'.format(amount,decimals=decimals))
+            heading = 'Component Concentrations:\n'
+            selected = np.ones(len(charge),dtype=bool)
         elif type == 'cations':
-            print('Cation Concentrations:\n')
-            print('========================\n')
-            for item in self.components:
-                if self.components[item].get_formal_charge() > 0:
-                    amount=self.get_amount(item,unit)
-                    result_list.append([item,amount])
-                    print(item+':'+'\t {0:0.{decimals}f~}'.format(amount,decimals=decimals))
+            heading = 'Cation Concentrations:\n'
+            selected = charge > 0
         elif type == 'anions':
-            print('Anion Concentrations:\n')
-            print('========================\n')
-            for item in self.components:
-                if self.components[item].get_formal_charge() < 0:
-                    amount=self.get_amount(item,unit)
-                    result_list.append([item,amount])
-                    print(item+':'+'\t {0:0.{decimals}f~}'.format(amount,decimals=decimals))
+            heading = 'Anion Concentrations:\n'
+            selected = charge < 0
+        else:
+            return result_list
+        
+        print(heading)
+        print('========================\n')
+        for item, amount, listed in zip(self.components,amounts,selected):
+            if listed:
+                amount = pyEQL.unit.Quantity(amount,amount_units)
+                result_list.append([item,amount])
+                print(item+':'+'\t {0:0.{decimals}f~}'.format(amount,decimals=decimals))
 
         return result_list
 
@@ -2346,10 +2679,12 @@ class Solution:
             Dictionary containing a list of the species in solution paired with their activity
             
         '''
+        activities = self.get_activities_array()
+        
         print('Component Activities:\n')
         print('=====================\n')
-        for i in self.components.keys():
-            print(i+':'+'\t {0.magnitude:0.{decimals}f}'.format(self.get_activity(i),decimals=decimals)) 
+        for i, activity in zip(self.components,activities):
+            print(i+':'+'\t {0:0.{decimals}f}'.format(activity,decimals=decimals)) 
      
     def __str__(self):
         #set output of the print() statement for the solution
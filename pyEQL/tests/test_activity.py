@@ -424,5 +424,131 @@ class Test_activity_pitzer_nacl(unittest.TestCase,pyEQL.CustomAssertions):
                 self.assertWithinExperimentalError(result,expected,self.tol)
 
 
+class Test_activity_arrays(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that the Debye-Huckel type activity coefficient functions give the 
+    same result for an array of ionic strengths as for each value individually
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.tol = 1e-9
+        self.ionic_strength = [0.001,0.05,0.3]
+        self.charge = [1,-2,3]
+        
+    def test_activity_arrays(self):
+        import numpy as np
+        import pyEQL.activity_correction as ac
+        
+        I_array = np.array(self.ionic_strength) * pyEQL.unit('mol/kg')
+        for func in [ac.get_activity_coefficient_debyehuckel,ac.get_activity_coefficient_guntelberg,ac.get_activity_coefficient_davies]:
+            result = func(I_array,np.array(self.charge)).magnitude
+            for i in range(len(self.ionic_strength)):
+                with self.subTest(func=func.__name__,I=self.ionic_strength[i]):
+                    expected = func(self.ionic_strength[i]*pyEQL.unit('mol/kg'),self.charge[i]).magnitude
+                    self.assertWithinExperimentalError(result[i],expected,self.tol)
+
+class Test_activity_model_selection(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that, without Pitzer parameters, get_activity_coefficient() uses the
+    Debye-Huckel, Guntelberg, or Davies equation according to the ionic strength
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.tol = 1e-9
+        # there are no Pitzer parameters for CsHCO3
+        self.molality = [0.001,0.004,0.05,0.3,0.8]
+        
+    def test_activity_model_selection(self):
+        import pyEQL.activity_correction as ac
+        
+        models = [ac.get_activity_coefficient_debyehuckel,ac.get_activity_coefficient_debyehuckel, \
+        ac.get_activity_coefficient_guntelberg,ac.get_activity_coefficient_davies,None]
+        for m, model in zip(self.molality,models):
+            with self.subTest(m=m):
+                s1 = pyEQL.Solution([['Cs+',str(m)+' mol/kg'],['HCO3-',str(m)+' mol/kg']])
+                result = s1.get_activity_coefficient('HCO3-').magnitude
+                if model is None:
+                    expected = 1
+                else:
+                    expected = model(s1.get_ionic_strength(),-1).magnitude
+                self.assertWithinExperimentalError(result,expected,self.tol)
+
+    def test_activities_array(self):
+        # get_activities_array() evaluates these ions together; it should agree
+        # with get_activity() on every scale
+        for m in self.molality:
+            s1 = pyEQL.Solution([['Cs+',str(m)+' mol/kg'],['HCO3-',str(m)+' mol/kg'],['Na+','0.01 mol/kg'],['Cl-','0.01 mol/kg']])
+            for scale in ['molal','molar','rational']:
+                activities = s1.get_activities_array(scale)
+                for i, item in enumerate(s1.components):
+                    with self.subTest(m=m,scale=scale,solute=item):
+                        expected = s1.get_activity(item,scale=scale).magnitude
+                        self.assertWithinExperimentalError(activities[i],expected,self.tol)
+
+class Test_debye_parameter_array(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that the Debye-Huckel parameter and the density of water evaluated over
+    an array of temperatures agree with the scalar results
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.tol = 1e-12
+        self.temperature = [5,25,37,60,90]
+
+    def test_debye_parameter_array(self):
+        import numpy as np
+        import pyEQL.activity_correction as ac
+        import pyEQL.water_properties as h2o
+
+        T = np.array(self.temperature) * pyEQL.unit('degC')
+        A = ac._debye_parameter_activity_array(T).magnitude
+        rho = h2o.water_density(T).magnitude
+        for i, t in enumerate(self.temperature):
+            with self.subTest(temperature=t):
+                self.assertWithinExperimentalError(A[i],ac._debye_parameter_activity(str(t)+' degC').magnitude,self.tol)
+                self.assertWithinExperimentalError(rho[i],h2o.water_density(t*pyEQL.unit('degC')).magnitude,self.tol)
+    
+    # converting a returned parameter in place must not change later results
+    def test_debye_parameter_ito(self):
+        import pyEQL.activity_correction as ac
+        
+        # a different unit for each parameter to convert to
+        other_units = {ac._debye_parameter_B:'cm ** 2 / kg ** 0.5 / mol ** 0.5',
+                       ac._debye_parameter_activity:'g ** 0.5 / mol ** 0.5',
+                       ac._debye_parameter_osmotic:'g ** 0.5 / mol ** 0.5',
+                       ac._debye_parameter_volume:'m ** 3 * kg ** 0.5 / mol ** 1.5'}
+        for func in other_units:
+            with self.subTest(function=func.__name__):
+                expected = func('30 degC')
+                magnitude, units = expected.magnitude, str(expected.units)
+                expected.ito(other_units[func])
+                result = func('30 degC')
+                self.assertEqual(str(result.units),units)
+                self.assertEqual(result.magnitude,magnitude)
+
+class Test_pitzer_factory(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that the function returned by make_activity_coefficient_pitzer() gives
+    the same result as get_activity_coefficient_pitzer()
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.tol = 1e-9
+        # Pitzer parameters for NaCl and for a 2:1 salt
+        self.params = [(2,0,0.07831,0.2677,0,0.000864,1,-1,1,1),(2,12,0.2,1.6,-50,0.005,2,-1,1,2)]
+        self.molality = [0.001,0.1,1,5]
+        
+    def test_pitzer_factory(self):
+        import pyEQL.activity_correction as ac
+        
+        for params in self.params:
+            activity_coefficient = ac.make_activity_coefficient_pitzer(*params)
+            for m in self.molality:
+                with self.subTest(params=params,m=m):
+                    ionic_strength = m * pyEQL.unit('mol/kg')
+                    result = activity_coefficient(ionic_strength,ionic_strength).magnitude
+                    expected = ac.get_activity_coefficient_pitzer(ionic_strength,ionic_strength,*params).magnitude
+                    self.assertWithinExperimentalError(result,expected,self.tol)
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,11 +6,20 @@ This file contains tests for the bulk properties calculated by
 Solution class methods. Currently included methods are:
 
 - get_hardness()
+- get_alkalinity()
+- get_mass()
+- get_total_moles_solute()
+- get_ionic_strength()
+- pyEQL.functions.mix()
+
+It also checks that these properties survive pickling and copying a Solution.
 
 '''
 
 import pyEQL
 import unittest
+import pickle
+import copy
 
 class test_hardness(unittest.TestCase,pyEQL.CustomAssertions):
     '''
@@ -67,5 +76,150 @@ class test_hardness(unittest.TestCase,pyEQL.CustomAssertions):
         
         self.assertEqual(result,expected)
         
+class test_alkalinity(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test the get_alkalinity() method
+    ------------------------------
+    '''
+    # an empty solution should have zero alkalinity
+    def test_empty_solution(self):
+        s1 = pyEQL.Solution()
+        result = s1.get_alkalinity().magnitude
+        expected = 0
+        
+        self.assertEqual(result,expected)
+        
+    # the alkalinity is the excess of base cations over acid anions, as CaCO3
+    def test_alkalinity_bicarbonate(self):
+        s1 = pyEQL.Solution([['Na+','0.003 mol/L'],['Cl-','0.002 mol/L'],['HCO3-','0.001 mol/L']])
+        result = s1.get_alkalinity().to('mg/L').magnitude
+        expected = 50.045
+        
+        self.assertWithinExperimentalError(result,expected,0.001)
+
+class test_mass(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test the get_mass() method
+    ------------------------------
+    '''
+    # the total mass should equal the sum of the mass of each component
+    def test_mass_sum(self):
+        s1 = pyEQL.Solution([['Mg+2','0.3 mol/kg'],['Na+','0.1 mol/kg'],['Cl-','0.7 mol/kg']])
+        result = s1.get_mass().to('kg').magnitude
+        expected = sum(s1.get_amount(item,'kg').magnitude for item in s1.components)
+        
+        self.assertWithinExperimentalError(result,expected,1e-9)
+    
+    # the total moles of solute should include every component except the solvent
+    def test_total_moles_solute(self):
+        s1 = pyEQL.Solution([['Mg+2','0.3 mol/kg'],['Na+','0.1 mol/kg'],['Cl-','0.7 mol/kg']])
+        s1.add_solute('K+','0.05 mol/kg')
+        result = s1.get_total_moles_solute().to('mol').magnitude
+        expected = sum(s1.get_amount(item,'mol').magnitude for item in s1.components if item != s1.solvent_name)
+        
+        self.assertWithinExperimentalError(result,expected,1e-9)
+
+class test_ionic_strength(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that get_ionic_strength() follows changes in composition
+    ------------------------------
+    '''
+    def setUp(self):
+        self.s1 = pyEQL.Solution([['Na+','0.1 mol/kg'],['Cl-','0.1 mol/kg']])
+        # populate the cached value before changing the composition
+        self.s1.get_ionic_strength()
+        
+    def test_ionic_strength_set_amount(self):
+        self.s1.set_amount('Na+','0.2 mol/kg')
+        self.s1.set_amount('Cl-','0.2 mol/kg')
+        result = self.s1.get_ionic_strength().magnitude
+        expected = 0.2
+        
+        self.assertWithinExperimentalError(result,expected,0.001)
+        
+    def test_ionic_strength_add_solute(self):
+        self.s1.add_solute('Mg+2','0.1 mol/kg')
+        result = self.s1.get_ionic_strength().magnitude
+        expected = 0.3
+        
+        self.assertWithinExperimentalError(result,expected,0.001)
+        
+    def test_ionic_strength_set_moles(self):
+        solute = self.s1.get_solute('Na+')
+        solute.moles = solute.moles * 3
+        result = self.s1.get_ionic_strength().magnitude
+        expected = 0.2
+        
+        self.assertWithinExperimentalError(result,expected,0.001)
+    
+    # converting a returned Quantity in place must not change the cached value
+    def test_ionic_strength_ito(self):
+        expected = self.s1.get_conductivity().magnitude
+        self.s1.get_ionic_strength().ito('mmol/kg')
+        self.s1.get_mass().ito('g')
+        self.s1.get_total_moles_solute().ito('mmol')
+        self.s1.get_moles_solvent().ito('mmol')
+        
+        self.assertWithinExperimentalError(self.s1.get_ionic_strength().magnitude,0.1,0.001)
+        self.assertWithinExperimentalError(self.s1.get_conductivity().magnitude,expected,1e-9)
+        self.assertEqual(str(self.s1.get_mass().units),str(pyEQL.unit('kg').units))
+        self.assertEqual(str(self.s1.get_total_moles_solute().units),str(pyEQL.unit('mol').units))
+        self.assertEqual(str(self.s1.get_moles_solvent().units),str(pyEQL.unit('mol').units))
+
+class test_mix(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test the mix() function
+    ------------------------------
+    '''
+    def setUp(self):
+        self.s1 = pyEQL.Solution([['Na+','0.5 mol/L'],['Cl-','0.5 mol/L']])
+        self.s2 = pyEQL.Solution([['K+','0.1 mol/L'],['Cl-','0.1 mol/L']])
+        self.blend = pyEQL.functions.mix(self.s1,self.s2)
+    
+    # solutes present in both solutions should have their amounts added
+    def test_mix_common_solute(self):
+        result = self.blend.get_amount('Cl-','mol').magnitude
+        expected = 0.6
+        
+        self.assertWithinExperimentalError(result,expected,0.001)
+    
+    # solutes present in only one solution should carry over unchanged
+    def test_mix_unique_solute(self):
+        result = [self.blend.get_amount('Na+','mol').magnitude,self.blend.get_amount('K+','mol').magnitude]
+        expected = [0.5,0.1]
+        
+        self.assertWithinExperimentalError(result[0],expected[0],0.001)
+        self.assertWithinExperimentalError(result[1],expected[1],0.001)
+        
+class test_copy(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that pickled and copied solutions are independent of the original
+    ------------------------------
+    '''
+    def setUp(self):
+        self.s1 = pyEQL.Solution([['Na+','0.1 mol/kg'],['Cl-','0.1 mol/kg']])
+        # fill the cached properties before copying
+        self.expected = self.s1.get_ionic_strength().magnitude
+        
+    def _check_independent(self,s2):
+        self.assertWithinExperimentalError(s2.get_ionic_strength().magnitude,self.expected,1e-9)
+        
+        # changing the copy must update the copy's cached properties, not the original's
+        s2.components['Na+'].moles = 1*pyEQL.unit('mol')
+        self.assertGreater(s2.get_ionic_strength().magnitude,0.5)
+        self.assertWithinExperimentalError(self.s1.get_ionic_strength().magnitude,self.expected,1e-9)
+        
+    def test_pickle(self):
+        s2 = pickle.loads(pickle.dumps(self.s1))
+        self.assertWithinExperimentalError(s2.get_amount('Na+','mol/L').magnitude,self.s1.get_amount('Na+','mol/L').magnitude,1e-9)
+        self._check_independent(s2)
+    
+    def test_pickle_solute(self):
+        solute = pickle.loads(pickle.dumps(self.s1.get_solute('Na+')))
+        self.assertEqual(solute.get_moles(),self.s1.get_solute('Na+').get_moles())
+    
+    def test_deepcopy(self):
+        self._check_independent(copy.deepcopy(self.s1))
+        
 if __name__ == '__main__':
     unittest.main()
@@ -153,7 +153,7 @@ class Test_is_valid_formula(unittest.TestCase,pyEQL.CustomAssertions):
         self.assertEqual(result,expected)
     
     # Formulas must contain only valid atomic symbols that start with capital letters
-    def test_is_valid_formula_9(self):
+    def test_is_valid_formula_19(self):
         input = 'naOH'
         result = cf.is_valid_formula(input)        
         expected = False
@@ -225,7 +225,7 @@ class Test_is_valid_formula(unittest.TestCase,pyEQL.CustomAssertions):
         self.assertEqual(result,expected)
     
     # An open parenthesis must always precede the nearest closed parenthesis
-    def test_is_valid_formula_17(self):
+    def test_is_valid_formula_20(self):
         input = 'CH3(CH)2(CH)2'
         result = cf.is_valid_formula(input)        
         expected = True
@@ -268,6 +268,47 @@ class Test_consolidate_formula(unittest.TestCase,pyEQL.CustomAssertions):
         
         self.assertEqual(result,expected)
 
+class Test_get_formal_charge(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    tests for get_formal_charge()
+    ------------------------------
+    '''
+    
+    def test_get_formal_charge_1(self):
+        input = 'H2O'
+        result = cf.get_formal_charge(input)
+        expected = 0
+        
+        self.assertEqual(result,expected)
+    
+    def test_get_formal_charge_2(self):
+        input = 'Fe+++'
+        result = cf.get_formal_charge(input)
+        expected = 3
+        
+        self.assertEqual(result,expected)
+    
+    def test_get_formal_charge_3(self):
+        input = 'PO4-3'
+        result = cf.get_formal_charge(input)
+        expected = -3
+        
+        self.assertEqual(result,expected)
+    
+    def test_get_formal_charge_4(self):
+        input = 'HCO3-'
+        result = cf.get_formal_charge(input)
+        expected = -1
+        
+        self.assertEqual(result,expected)
+    
+    def test_get_formal_charge_5(self):
+        input = 'Fe(OH)2+'
+        result = cf.get_formal_charge(input)
+        expected = 1
+        
+        self.assertEqual(result,expected)
+
 
 if __name__ == '__main__':
     unittest.main()
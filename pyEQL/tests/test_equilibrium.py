@@ -0,0 +1,104 @@
+'''
+pyEQL equilibrium test suite
+============================
+
+This file contains tests for the acid-base and temperature adjustment
+functions in equilibrium.py
+
+'''
+
+import pyEQL
+import pyEQL.equilibrium
+import unittest
+
+class Test_alpha(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test the acid-base distribution coefficient (alpha)
+    ------------------------------------------------
+    
+    '''
+    def setUp(self):
+        # relative error tolerance for assertWithinExperimentalError
+        self.tol = 0.01
+        # pKa values for carbonic acid
+        self.pKa_list = [6.35,10.33]
+    
+    # the alpha values of all forms of the acid should sum to 1
+    def test_alpha_sum(self):
+        for pH in [2,6.35,8,10.33,12]:
+            result = sum(pyEQL.equilibrium.alpha(n,pH,self.pKa_list) for n in range(3))
+            self.assertAlmostEqual(result,1,places=12)
+    
+    # alpha should equal 0.5 when the pH equals the pKa of a monoprotic acid
+    def test_alpha_pKa(self):
+        result = pyEQL.equilibrium.alpha(1,4.7,[4.7])
+        expected = 0.5
+        
+        self.assertAlmostEqual(result,expected,places=12)
+    
+    def test_alpha_carbonate(self):
+        '''
+        At pH 8, about 0.46 % of dissolved inorganic carbon is present as carbonate
+        
+        alpha_2 = ka1*ka2 / ([H+]^2 + ka1*[H+] + ka1*ka2)
+        '''
+        Hplus = 1e-8
+        ka1 = 10 ** -6.35
+        ka2 = 10 ** -10.33
+        
+        result = pyEQL.equilibrium.alpha(2,8,self.pKa_list)
+        expected = ka1 * ka2 / (Hplus ** 2 + ka1 * Hplus + ka1 * ka2)
+        
+        self.assertWithinExperimentalError(result,expected,self.tol)
+
+    # too few pKa values returns None
+    def test_alpha_insufficient_pKa(self):
+        self.assertIsNone(pyEQL.equilibrium.alpha(2,8,[6.35]))
+    
+    # alpha_batch should give the same result as calling alpha at each pH
+    def test_alpha_batch(self):
+        pH_list = [2,4.5,6.35,8,10.33,12]
+        for n in range(3):
+            result = pyEQL.equilibrium.alpha_batch(n,pH_list,self.pKa_list)
+            for i in range(len(pH_list)):
+                expected = pyEQL.equilibrium.alpha(n,pH_list[i],self.pKa_list)
+                self.assertWithinExperimentalError(result[i],expected,1e-9)
+
+class Test_temperature_adjustment(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test the Van't Hoff and Arrhenius temperature adjustments
+    ------------------------------------------------
+    
+    '''
+    def setUp(self):
+        # relative error tolerance for assertWithinExperimentalError
+        self.tol = 0.0001
+    
+    # omitting the reference temperature should be the same as specifying 25 degC
+    def test_vanthoff_default_reference(self):
+        result = pyEQL.equilibrium.adjust_temp_vanthoff(0.15,-197.6*pyEQL.unit('kJ/mol'),42*pyEQL.unit('degC'))
+        expected = pyEQL.equilibrium.adjust_temp_vanthoff(0.15,-197.6*pyEQL.unit('kJ/mol'),42*pyEQL.unit('degC'),298.15*pyEQL.unit('K'))
+        
+        self.assertWithinExperimentalError(result,expected,self.tol)
+        
+    def test_vanthoff(self):
+        result = pyEQL.equilibrium.adjust_temp_vanthoff(0.15,-197.6*pyEQL.unit('kJ/mol'),42*pyEQL.unit('degC'),25*pyEQL.unit('degC'))
+        expected = 0.00203566
+        
+        self.assertWithinExperimentalError(result,expected,self.tol)
+    
+    def test_arrhenius(self):
+        result = pyEQL.equilibrium.adjust_temp_arrhenius(7,900*pyEQL.unit('kJ/mol'),37*pyEQL.unit('degC'),97*pyEQL.unit('degC'))
+        expected = 1.8867225e-24
+        
+        self.assertWithinExperimentalError(result,expected,self.tol)
+    
+    # a single temperature should give a plain float, not a numpy scalar
+    def test_scalar_type(self):
+        result = pyEQL.equilibrium.adjust_temp_vanthoff(0.15,-197.6*pyEQL.unit('kJ/mol'),42*pyEQL.unit('degC'))
+        self.assertIs(type(result),float)
+        result = pyEQL.equilibrium.adjust_temp_arrhenius(7,900*pyEQL.unit('kJ/mol'),37*pyEQL.unit('degC'),97*pyEQL.unit('degC'))
+        self.assertIs(type(result),float)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+'''
+pyEQL compiled kernel test suite
+================================
+
+This file checks that the numerical kernels decorated with njit compile under
+numba and give the same results as their pure Python implementations. The
+tests are skipped when numba is not installed, because the kernels then run
+as ordinary Python and are covered by the rest of the test suite. Install the
+optional dependency with pip install .[numba] (or run tox -e numba) to
+include them.
+
+'''
+
+import pyEQL
+import pyEQL.activity_correction as ac
+import pyEQL.equilibrium
+import pyEQL.solution
+import pyEQL.water_properties as h2o
+from pyEQL.jit import HAS_NUMBA
+import numpy as np
+import unittest
+
+@unittest.skipUnless(HAS_NUMBA,'numba is not installed')
+class Test_compiled_kernels(unittest.TestCase):
+    '''
+    test that each compiled kernel matches its pure Python implementation
+    ---------------------------------------------------------------------
+
+    '''
+    def setUp(self):
+        # relative error tolerance for the comparison with the Python implementation
+        self.tol = 1e-12
+        # Debye parameter at 25 degC and ionic strengths spanning the validity
+        # limits of the Debye-Huckel family of equations
+        self.A = 1.1744
+        self.I_list = [0.0,0.0005,0.05,0.3,1.0]
+        self.z = np.array([1,-1,2,-2,3])
+
+    def assertKernelMatches(self,kernel,*args):
+        result = np.asarray(kernel(*args))
+        expected = np.asarray(kernel.py_func(*args))
+        self.assertEqual(result.shape,expected.shape)
+        # compare with a relative tolerance, which also handles zero results
+        np.testing.assert_allclose(result,expected,rtol=self.tol)
+        # make sure the kernel was actually compiled
+        self.assertTrue(kernel.signatures)
+
+    # the single-ion activity kernels accept scalars and arrays of charges
+    def test_debyehuckel_family(self):
+        for kernel in [ac._debyehuckel_gamma,ac._guntelberg_gamma,ac._davies_gamma]:
+            for I in self.I_list:
+                with self.subTest(kernel=kernel.__name__,I=I):
+                    self.assertKernelMatches(kernel,self.A,self.z,np.full(self.z.shape,I))
+                    self.assertKernelMatches(kernel,self.A,np.asarray(2),I)
+
+    def test_debyehuckel_family_gamma(self):
+        for I in self.I_list:
+            with self.subTest(I=I):
+                self.assertKernelMatches(ac._debyehuckel_family_gamma,self.A,self.z.astype(float),I)
+
+    def test_pitzer_functions(self):
+        for kernel in [ac._pitzer_f1,ac._pitzer_f2]:
+            for x in [0.0,0.01,1.0,2.0,12.0]:
+                with self.subTest(kernel=kernel.__name__,x=x):
+                    self.assertKernelMatches(kernel,x)
+
+    def test_alpha_batch(self):
+        Hplus = 10 ** -np.linspace(0,14,29)
+        ka = 10 ** -np.array([2.15,7.2,12.35])
+        for n in range(4):
+            with self.subTest(n=n):
+                self.assertKernelMatches(pyEQL.equilibrium._alpha_batch,n,Hplus,ka)
+
+    def test_nernst_einstein(self):
+        F2_RT = pyEQL.solution._faraday_squared_over_RT(298.15)
+        for z in [1,-2,3]:
+            with self.subTest(z=z):
+                self.assertKernelMatches(pyEQL.solution._nernst_einstein,z,1.334e-9,F2_RT)
+
+    def test_water_viscosity(self):
+        T_K = np.linspace(273.15,373.15,11)
+        rho = np.array([h2o._water_density(T - 273.15) for T in T_K])
+        self.assertKernelMatches(h2o._water_viscosity_dynamic_batch,T_K,rho)
+        for T, d in zip(T_K,rho):
+            with self.subTest(T=T):
+                self.assertKernelMatches(h2o._water_viscosity_dynamic,T,d)
+
+if __name__ == '__main__':
+    unittest.main()
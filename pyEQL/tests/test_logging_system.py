@@ -0,0 +1,64 @@
+'''
+pyEQL logging system test suite
+============================================
+
+This file contains tests for the Unique log filter and the logger setup
+in pyEQL.logging_system
+
+'''
+
+import pyEQL
+import pyEQL.logging_system
+import logging
+import unittest
+
+class Test_unique_filter(unittest.TestCase):
+    '''
+    test that the Unique filter passes each message only once
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.filter = pyEQL.logging_system.Unique(maxsize=3)
+    
+    def _record(self,msg,*args):
+        return logging.LogRecord('pyEQL',logging.INFO,__file__,0,msg,args,None)
+    
+    def test_repeated_message(self):
+        self.assertTrue(self.filter.filter(self._record('Computed %s',1)))
+        self.assertFalse(self.filter.filter(self._record('Computed %s',1)))
+        self.assertTrue(self.filter.filter(self._record('Computed %s',2)))
+    
+    # once more than maxsize messages are seen, the oldest is emitted again
+    def test_maxsize(self):
+        for i in range(4):
+            self.assertTrue(self.filter.filter(self._record('message %s',i)))
+        self.assertFalse(self.filter.filter(self._record('message %s',3)))
+        self.assertTrue(self.filter.filter(self._record('message %s',0)))
+    
+    def test_reset(self):
+        self.filter.filter(self._record('message'))
+        self.filter.reset()
+        self.assertTrue(self.filter.filter(self._record('message')))
+
+class Test_configure_logger(unittest.TestCase):
+    '''
+    test that configure_logger() attaches one handler and filter per logger
+    ------------------------------------------------
+    '''
+    def test_configure_once(self):
+        logger = logging.getLogger('pyEQL.tests.configure_logger')
+        for i in range(3):
+            pyEQL.logging_system.configure_logger(logger)
+        self.assertEqual(len(logger.handlers),1)
+        self.assertEqual(len(logger.filters),1)
+        self.assertIsInstance(logger.filters[0],pyEQL.logging_system.Unique)
+    
+    # reloading a module must not attach a second handler
+    def test_reload(self):
+        import importlib
+        import pyEQL.equilibrium
+        importlib.reload(pyEQL.equilibrium)
+        self.assertEqual(len(pyEQL.equilibrium.logger.handlers),1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -415,7 +415,71 @@ class Test_get_amount(unittest.TestCase,pyEQL.CustomAssertions):
         
         self.assertAlmostEqual(result,expected,9)    
     
+    # get_amounts_array() should agree with get_amount() for each component
+    def test_get_amounts_array(self):
+        for units in ['mol','mg','mol/L','mg/L','mol/kg','mg/kg','fraction','%']:
+            result = self.s1.get_amounts_array(units)
+            for i, item in enumerate(self.s1.components):
+                with self.subTest(units=units,solute=item):
+                    expected = self.s1.get_amount(item,units).magnitude
+                    self.assertWithinExperimentalError(result[i],expected,1e-9)
+    
+class Test_cached_volume(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that get_volume() and get_solvent_mass() follow changes to the solution
+    after their values have been cached
+    -----------------------------------------------------------------
     
+    '''
+    def setUp(self):
+        self.s1 = pyEQL.Solution([['Na+','1 mol/kg'],['Cl-','1 mol/kg']])
+        # populate the cached values
+        self.s1.get_volume()
+        self.s1.get_solvent_mass()
+    
+    # the volume should increase when the solution is heated
+    def test_volume_set_temperature(self):
+        initial = self.s1.get_volume().to('L').magnitude
+        self.s1.set_temperature('50 degC')
+        result = self.s1.get_volume().to('L').magnitude
+        
+        self.assertGreater(result,initial)
+    
+    # the volume should be what was set by set_volume()
+    def test_volume_set_volume(self):
+        self.s1.set_volume('3 L')
+        result = self.s1.get_volume().to('L').magnitude
+        expected = 3
+        
+        self.assertWithinExperimentalError(result,expected,1e-9)
+    
+    # the solvent mass should follow changes in the amount of solvent
+    def test_solvent_mass_set_amount(self):
+        self.s1.set_amount('H2O','2 kg')
+        result = self.s1.get_solvent_mass().to('kg').magnitude
+        expected = 2
+        
+        self.assertWithinExperimentalError(result,expected,1e-9)
+    
+    # converting a returned Quantity in place must not change later results
+    def test_volume_ito(self):
+        expected = self.s1.get_volume().to('L').magnitude
+        self.s1.get_volume().ito('mL')
+        self.s1.get_solvent_mass().ito('g')
+        result = self.s1.get_volume()
+        
+        self.assertEqual(str(result.units),str(pyEQL.unit('L').units))
+        self.assertWithinExperimentalError(result.magnitude,expected,1e-9)
+        self.assertEqual(str(self.s1.get_solvent_mass().units),str(pyEQL.unit('kg').units))
+    
+    # converting the volume attribute in place should give the same volume
+    def test_volume_attribute_ito(self):
+        expected = self.s1.get_volume().magnitude
+        self.s1.volume.ito('mL')
+        result = self.s1.get_volume()
+        
+        self.assertEqual(str(result.units),str(pyEQL.unit('L').units))
+        self.assertWithinExperimentalError(result.magnitude,expected,1e-9)
     
     
 if __name__ == '__main__':
@@ -0,0 +1,159 @@
+'''
+pyEQL water properties test suite
+============================================
+
+This file contains tests for the functions in pyEQL.water_properties
+that calculate the properties of pure water.
+
+'''
+
+import pyEQL
+import pyEQL.water_properties as h2o
+import numpy as np
+import unittest
+
+class Test_water_properties_array(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that the array functions agree with the scalar (Quantity) functions
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.tol = 1e-12
+        self.temperature = np.array([274,283.15,298.15,323.15,350,371])
+        
+    def test_water_density_array(self):
+        result = h2o.water_density_array(self.temperature)
+        for i, T in enumerate(self.temperature):
+            with self.subTest(temperature=T):
+                expected = h2o.water_density(pyEQL.unit.Quantity(T,'K')).magnitude
+                self.assertWithinExperimentalError(result[i],expected,self.tol)
+    
+    def test_water_viscosity_dynamic_array(self):
+        result = h2o.water_viscosity_dynamic_array(self.temperature,1e6)
+        for i, T in enumerate(self.temperature):
+            with self.subTest(temperature=T):
+                expected = h2o.water_viscosity_dynamic(pyEQL.unit.Quantity(T,'K'),pyEQL.unit('1 MPa')).magnitude
+                self.assertWithinExperimentalError(result[i],expected,self.tol)
+    
+    # the compiled kernel used when numba is installed should give the same result
+    def test_water_viscosity_dynamic_batch(self):
+        rho = h2o.water_density_array(self.temperature)
+        result = h2o._water_viscosity_dynamic_batch(self.temperature,rho)
+        expected = h2o.water_viscosity_dynamic_array(self.temperature)
+        for i, T in enumerate(self.temperature):
+            with self.subTest(temperature=T):
+                self.assertWithinExperimentalError(result[i],expected[i],self.tol)
+    
+    def test_water_dielectric_constant_array(self):
+        result = h2o.water_dielectric_constant_array(self.temperature)
+        for i, T in enumerate(self.temperature):
+            with self.subTest(temperature=T):
+                expected = h2o.water_dielectric_constant(pyEQL.unit.Quantity(T,'K'))
+                self.assertWithinExperimentalError(result[i],expected,self.tol)
+    
+    # a column of temperatures and a row of pressures should give a T x P grid
+    def test_pressure_temperature_grid(self):
+        P = np.array([1e5,1e6,1e7])
+        T = self.temperature[:,np.newaxis]
+        self.assertEqual(h2o.water_density_array(T,P).shape,(len(self.temperature),len(P)))
+        result = h2o.water_viscosity_dynamic_array(T,P)
+        self.assertEqual(result.shape,(len(self.temperature),len(P)))
+        for j in range(len(P)):
+            with self.subTest(pressure=P[j]):
+                expected = h2o.water_viscosity_dynamic_array(self.temperature,P[j])
+                self.assertTrue(np.array_equal(result[:,j],expected))
+    
+    # states outside the valid range of the equations should be NaN
+    def test_out_of_range(self):
+        self.assertTrue(np.isnan(h2o.water_viscosity_dynamic_array([298.15],2e8))[0])
+        self.assertTrue(np.isnan(h2o.water_dielectric_constant_array([400]))[0])
+
+class Test_backend(unittest.TestCase):
+    '''
+    test that get_backend() reports whether the kernels are compiled
+    ------------------------------------------------
+    '''
+    def test_get_backend(self):
+        from pyEQL.jit import HAS_NUMBA
+        expected = 'numba' if HAS_NUMBA else 'python'
+        self.assertEqual(h2o.get_backend(),expected)
+
+class Test_water_properties_cache(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that repeated calls return the result for the state that was requested
+    ------------------------------------------------
+    '''
+    def test_same_magnitude_different_units(self):
+        # 25 degC is cached first; 25 K must not return the cached value
+        self.assertIsNotNone(h2o.water_dielectric_constant(pyEQL.unit('25 degC')))
+        self.assertIsNone(h2o.water_dielectric_constant(pyEQL.unit('25 K')))
+    
+    def test_repeated_call(self):
+        first = h2o.water_viscosity_dynamic(pyEQL.unit('30 degC'),pyEQL.unit('1 atm')).magnitude
+        h2o.water_viscosity_dynamic(pyEQL.unit('60 degC'),pyEQL.unit('1 atm'))
+        result = h2o.water_viscosity_dynamic(pyEQL.unit('30 degC'),pyEQL.unit('1 atm')).magnitude
+        
+        self.assertEqual(result,first)
+    
+    # converting a returned Quantity in place must not change later results
+    def test_result_not_shared(self):
+        T = pyEQL.unit('35 degC')
+        first = h2o.water_density(T)
+        first.ito('g/L')
+        result = h2o.water_density(T)
+        self.assertIsNot(result,first)
+        self.assertEqual(str(result.units),str(pyEQL.unit('kg/m**3').units))
+        h2o.water_properties(T)[0].ito('g/L')
+        self.assertEqual(h2o.water_properties(T)[0].units,result.units)
+
+class Test_make_water_density(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that the fixed-pressure density function agrees with water_density()
+    ------------------------------------------------
+    '''
+    def test_make_water_density(self):
+        pressure = pyEQL.unit('10 MPa')
+        density = h2o.make_water_density(pressure)
+        for T in ['0 degC','25 degC','80 degC','300 K']:
+            with self.subTest(temperature=T):
+                result = density(pyEQL.unit(T))
+                expected = h2o.water_density(pyEQL.unit(T),pressure)
+                self.assertEqual(result.units,expected.units)
+                self.assertWithinExperimentalError(result.magnitude,expected.magnitude,1e-12)
+    
+    def test_make_water_density_array(self):
+        T = np.array([10,20,30])
+        result = h2o.make_water_density()(pyEQL.unit.Quantity(T,'degC')).magnitude
+        expected = h2o.water_density_array(T + 273.15)
+        self.assertTrue(np.allclose(result,expected,rtol=1e-12))
+
+class Test_water_properties_float(unittest.TestCase,pyEQL.CustomAssertions):
+    '''
+    test that quantity=False returns the magnitude of the Quantity in SI units
+    ------------------------------------------------
+    '''
+    def setUp(self):
+        self.temperature = pyEQL.unit('40 degC')
+        self.pressure = pyEQL.unit('2 atm')
+    
+    def test_quantity_false(self):
+        for func in [h2o.water_density,h2o.water_specific_weight,h2o.water_viscosity_dynamic,h2o.water_viscosity_kinematic]:
+            with self.subTest(function=func.__name__):
+                result = func(self.temperature,self.pressure,quantity=False)
+                expected = func(self.temperature,self.pressure).to_base_units().magnitude
+                self.assertIsInstance(result,float)
+                self.assertWithinExperimentalError(result,expected,1e-12)
+    
+    def test_water_properties_quantity_false(self):
+        result = h2o.water_properties(self.temperature,self.pressure,quantity=False)
+        expected = h2o.water_properties(self.temperature,self.pressure)
+        self.assertEqual(result[0],expected[0].magnitude)
+        self.assertEqual(result[1],expected[1].magnitude)
+        self.assertEqual(result[2],expected[2])
+    
+    # out of range states should still return None
+    def test_quantity_false_out_of_range(self):
+        self.assertIsNone(h2o.water_viscosity_dynamic(pyEQL.unit('900 degC'),quantity=False))
+
+if __name__ == '__main__':
+    unittest.main()
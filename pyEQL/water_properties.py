@@ -6,34 +6,257 @@ pyEQL water properties library
 This file contains functions for retrieving various physical properties
 of water substance
 
+The properties are calculated from closed-form correlations rather than a
+full equation of state (e.g. IAPWS-95), so each evaluation is inexpensive:
+
+- density: empirical equation of Sohnel and Novotny (water_density)
+- dynamic viscosity: NIST equation of Sengers, 273 - 1073 K and 0 - 100 MPa
+  (water_viscosity_dynamic)
+- dielectric constant: quadratic fit of CRC Handbook data, 273 - 372 K
+  (water_dielectric_constant)
+
+Because these are closed-form expressions, they are evaluated directly rather
+than interpolated from precomputed tables; a spline lookup is no faster than
+the correlations themselves.
+
 :copyright: 2013-2018 by Ryan S. Kingsbury
 :license: LGPL, see LICENSE for more details.
 
 '''
 import math
+import numpy as np
+from numpy.polynomial import polynomial as poly
+from functools import lru_cache, wraps
 
 from pyEQL import unit
 
+# optional numba compilation of the numerical kernels
+from pyEQL.jit import njit, prange, HAS_NUMBA
+
 # logging system
 import logging
 logger = logging.getLogger(__name__)
 
-# add a filter to emit only unique log messages to the handler
 import pyEQL.logging_system
-unique = pyEQL.logging_system.Unique()
-logger.addFilter(unique)
+pyEQL.logging_system.configure_logger(logger)
+
+# default conditions for the property functions below
+_DEFAULT_TEMPERATURE = 25*unit('degC')
+_DEFAULT_PRESSURE = 1*unit('atm')
+
+# standard acceleration of gravity, m/s2. See water_specific_weight()
+_STANDARD_GRAVITY = unit('g_n').to('m/s**2').magnitude
+
+# constants of the NIST equation for the viscosity of water substance
+# reference temperature (K), density (kg/m3) and viscosity (Pa-s)
+_VISC_T_STAR = 647.27
+_VISC_RHO_STAR = 317.763
+_VISC_MU_STAR = 1e-6
+# valid range of the equation, in K and Pa
+_VISC_T_MIN = 273
+_VISC_T_MAX = 1073
+_VISC_P_MIN = 0
+_VISC_P_MAX = 1e8
+# coefficients
+_VISC_A = np.array([0.0181583,0.0177624,0.0105287,-0.0036477])
+_VISC_B = np.array([[0.501938,0.235622,-0.274637,0.145831,-0.0270448],
+                    [0.162888,0.789393,-0.743539,0.263129,-0.0253093],
+                    [-0.130356,0.673665,-0.959456,0.347247,-0.0267758],
+                    [0.907919,1.207552,-0.687343,0.213486,-0.0822904],
+                    [-0.551119,0.0670665,-0.497089,0.100754,0.0602253],
+                    [0.146543,-0.0843370,0.195286,-0.032932,-0.0202595]])
+
+@njit(cache=True)
+def _water_viscosity_dynamic(T_K,rho):
+    '''
+    Numerical core of water_viscosity_dynamic(). Operates on plain floats.
+    
+    Parameters
+    ----------
+    T_K : float
+        The temperature in Kelvin
+    rho : float
+        The density of water in kg/m3
+        
+    Returns
+    -------
+    float
+        The dynamic viscosity of water in kg/m-s
+    
+    '''
+    # calculate dimensionless temperature and density
+    T_bar = T_K / _VISC_T_STAR
+    rho_bar = rho / _VISC_RHO_STAR
+    
+    # calculate the first function, mu_o
+    # sum_o = sum(a[i] * T_bar ** -i) is a polynomial in 1/T_bar, evaluated
+    # using Horner's rule
+    inv_T = 1 / T_bar
+    sum_o = 0.0
+    for i in range(_VISC_A.shape[0]-1,-1,-1):
+        sum_o = sum_o * inv_T + _VISC_A[i]
+    
+    mu_o = _VISC_MU_STAR * math.sqrt(T_bar) / sum_o
+    
+    # calculate the second fucntion, mu_1
+    # sum(b[i][j] * (1/T_bar - 1)**i * (rho_bar - 1)**j) is a polynomial in
+    # (rho_bar - 1) for each i, nested in a polynomial in (1/T_bar - 1).
+    # Evaluate both using Horner's rule
+    t = inv_T - 1
+    r = rho_bar - 1
+    mu_temp = 0.0
+    for i in range(_VISC_B.shape[0]-1,-1,-1):
+        row = 0.0
+        for j in range(_VISC_B.shape[1]-1,-1,-1):
+            row = row * r + _VISC_B[i,j]
+        mu_temp = mu_temp * t + row
+    mu_temp = rho_bar * mu_temp
+    
+    mu_1 = math.exp(mu_temp)
+    
+    # multiply the functions to return the viscosity
+    return float(mu_o * mu_1)
 
-# add a handler for console output, since pyEQL is meant to be used interactively
-ch = logging.StreamHandler()
+@njit(parallel=True,cache=True)
+def _water_viscosity_dynamic_batch(T_K,rho):
+    '''
+    Evaluate _water_viscosity_dynamic() for each element of the 1-D float arrays
+    T_K (K) and rho (kg/m3). The states are independent, so they are evaluated
+    in parallel. See water_viscosity_dynamic_array()
+    '''
+    output = np.empty(T_K.shape[0])
+    
+    for k in prange(T_K.shape[0]):
+        output[k] = _water_viscosity_dynamic(T_K[k],rho[k])
+    
+    return output
+
+# the property functions below are pure functions of temperature, and are
+# called repeatedly with the same arguments (e.g. by Solution methods), so the
+# float-valued kernels are memoized. Unit handling and logging stay in the
+# public wrappers.
+def _water_density(T_C):
+    '''
+    Return the density of water in kg/m3 at a temperature given in Celsius.
+    T_C may be a float or an array. See water_density()
+    '''
+    return 999.65 + 0.20438 * T_C - 6.1744e-2 * T_C * np.sqrt(T_C)
+
+@lru_cache(maxsize=128)
+def _water_density_cached(T_C):
+    return float(_water_density(T_C))
+
+def _water_density_magnitude(temperature):
+    '''
+    Return the density of water in kg/m3 at 'temperature' (a Quantity whose
+    magnitude may be an array) as a float or array. See water_density()
+    '''
+    T_C = temperature.to('degC').magnitude
+    
+    # arrays of temperatures can't be memoized, so evaluate them directly
+    if np.ndim(T_C) == 0:
+        return _water_density_cached(T_C)
+    else:
+        return _water_density(T_C)
+
+# coefficients a, b, c of the quadratic fit for the dielectric constant of water
+_DIELECTRIC_COEFFS = (0.24921e3, -0.79069e0, 0.72997e-3)
+# valid range of the fit, in K
+_DIELECTRIC_T_MIN = 273.0
+_DIELECTRIC_T_MAX = 372.0
+
+def _water_dielectric_constant(T_K):
+    '''
+    Return the dielectric constant of water at a temperature given in Kelvin.
+    T_K may be a float or an array. See water_dielectric_constant()
+    '''
+    a, b, c = _DIELECTRIC_COEFFS
+    # a + b T + c T^2, evaluated using Horner's rule
+    return (c * T_K + b) * T_K + a
+
+_water_dielectric_constant_cached = lru_cache(maxsize=128)(_water_dielectric_constant)
+
+@lru_cache(maxsize=1024)
+def _water_state(T_C,T_K):
+    '''
+    Return the density (kg/m3) and dynamic viscosity (kg/m-s) of water at a
+    temperature given in both Celsius and Kelvin, as plain floats.
+    
+    The viscosity depends on the density, and several functions need both, so
+    they share this memoized result and each temperature is evaluated only once.
+    The caller must check that the temperature and pressure are within the valid
+    range of the viscosity equation. See _check_viscosity_range()
+    '''
+    rho = _water_density_cached(T_C)
+    return rho, _water_viscosity_dynamic(T_K,rho)
+
+def _check_viscosity_range(T_K,P_Pa,temperature,pressure):
+    '''
+    Return True if T_K (K) and P_Pa (Pa) are within the valid range of the NIST
+    equation for the viscosity of water. Otherwise, log an error and return False.
+    '''
+    if T_K < _VISC_T_MIN or T_K > _VISC_T_MAX:
+        logger.error('Specified temperature (%s) exceeds valid range of NIST equation for viscosity of water. Cannot extrapolate.', temperature)
+        return False
+        
+    if P_Pa < _VISC_P_MIN or P_Pa > _VISC_P_MAX:
+        logger.error('Specified pressure (%s) exceeds valid range of NIST equation for viscosity of water. Cannot extrapolate.', pressure)
+        return False
+    
+    return True
 
-# create formatter for the log
-formatter = logging.Formatter('(%(name)s) - %(levelname)s - %(message)s')
+def _copy_result(result):
+    '''
+    Return a new Quantity (or tuple of them) equal to 'result', so that callers
+    of a cached function never share a mutable object. See _last_value_cache()
+    '''
+    if isinstance(result,unit.Quantity):
+        return unit.Quantity(result.magnitude,result.units)
+    elif isinstance(result,tuple):
+        return tuple(_copy_result(item) for item in result)
+    else:
+        return result
 
-# add formatter to the handler
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+def _last_value_cache(func):
+    '''
+    Decorator that remembers the arguments and the result of the most recent
+    call to one of the Quantity-valued property functions below.
+    
+    Callers (e.g. a Solution at a fixed temperature) usually evaluate the same
+    state many times in a row. A repeated call then returns the stored result
+    without any unit conversion. The units are part of the key, so 25 degC and
+    25 K are distinguished. Calls with keyword or array arguments are not cached.
+    
+    Each call returns a new Quantity, so a caller that modifies the result in
+    place (e.g. with ito()) does not change what later callers receive. The key
+    and result are stored together as one tuple, so a concurrent call can never
+    pair one call's key with another call's result.
+    '''
+    last = [None]
+    
+    @wraps(func)
+    def wrapper(*args,**kwargs):
+        if kwargs:
+            return func(*args,**kwargs)
+        
+        try:
+            key = tuple((arg.magnitude,arg.units) for arg in args)
+            hash(key)
+        except (AttributeError,TypeError):
+            return func(*args)
+        
+        cached = last[0]
+        if cached is not None and cached[0] == key:
+            return _copy_result(cached[1])
+        
+        result = func(*args)
+        last[0] = (key,result)
+        return _copy_result(result)
+    
+    return wrapper
 
-def water_density(temperature=25*unit('degC'),pressure=1*unit('atm')):
+@_last_value_cache
+def water_density(temperature=_DEFAULT_TEMPERATURE,pressure=_DEFAULT_PRESSURE,quantity=True):
     # TODO add pressure??
     # TODO more up to date equation??
     '''    
@@ -46,10 +269,14 @@ def water_density(temperature=25*unit('degC'),pressure=1*unit('atm')):
     pressure    : float or int, optional
                   The ambient pressure of the solution in Pascals (N/m2). 
                   Defaults to atmospheric pressure (101325 Pa) if not specified.
+    quantity    : bool, optional
+                  If False, return the result in SI units as a plain float
+                  instead of a Quantity, without any logging. This avoids the
+                  overhead of pint in inner loops. Defaults to True.
     
     Returns
     -------
-    float
+    Quantity or float
             The density of water in kg/m3.
     
     Notes
@@ -68,17 +295,68 @@ def water_density(temperature=25*unit('degC'),pressure=1*unit('atm')):
     --------
     >>> water_density(25*unit('degC')) #doctest: +ELLIPSIS
     <Quantity(997.0415, 'kilogram / meter ** 3')>
+    >>> water_density(25*unit('degC'),quantity=False)
+    997.0415
     
     '''
-    # calculate the magnitude
-    density = 999.65 + 0.20438 * temperature.to('degC').magnitude - 6.1744e-2 * temperature.to('degC').magnitude ** 1.5
-    # assign the proper units
-    density = density  * unit('kg/m**3')
-    logger.info('Computed density of water as %s at T= %s and P = %s' % (density,temperature,pressure))
+    # calculate the magnitude and assign the proper units
+    rho = _water_density_magnitude(temperature)
+    if not quantity:
+        return rho
+    
+    density = unit.Quantity(rho,'kg/m**3')
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Computed density of water as %s at T= %s and P = %s', density,temperature,pressure)
     logger.debug('Computed density of water using empirical relation in Sohnel and Novotny, "Densities of Aqueous Solutions of Inorganic Substances," 1985' )
-    return density.to('kg/m**3')
-    
-def water_specific_weight(temperature=25*unit('degC'),pressure=1*unit('atm')):
+    return density
+
+def make_water_density(pressure=_DEFAULT_PRESSURE):
+    '''
+    Return a function that computes the density of water at a fixed pressure.
+
+    Use this when the density is needed at many temperatures and one pressure,
+    e.g. inside an iterative calculation. Per call, the returned function does
+    only the temperature conversion and the (memoized) density evaluation, with
+    no logging or argument checks.
+
+    Parameters
+    ----------
+    pressure    : Quantity, optional
+                  The ambient pressure of the solution.
+                  Defaults to atmospheric pressure (1 atm) if omitted.
+
+    Returns
+    -------
+    function
+            A function of a single argument, the temperature (Quantity), that
+            returns the density of water in kg/m3 as a Quantity.
+
+    Notes
+    -----
+    The empirical equation used by water_density() does not depend on pressure,
+    so the result of the returned function is identical to that of
+    water_density(temperature,pressure).
+
+    Examples
+    --------
+    >>> density_1atm = make_water_density(1*unit('atm'))
+    >>> density_1atm(25*unit('degC')) #doctest: +ELLIPSIS
+    <Quantity(997.0415, 'kilogram / meter ** 3')>
+
+    See Also
+    --------
+    water_density
+
+    '''
+    logger.info('Created fixed-pressure water density function at P = %s', pressure)
+
+    def density(temperature=_DEFAULT_TEMPERATURE):
+        return unit.Quantity(_water_density_magnitude(temperature),'kg/m**3')
+
+    return density
+
+@_last_value_cache
+def water_specific_weight(temperature=_DEFAULT_TEMPERATURE,pressure=_DEFAULT_PRESSURE,quantity=True):
     '''    
     Return the specific weight of water in N/m3 at the specified temperature and pressure.
     
@@ -89,10 +367,14 @@ def water_specific_weight(temperature=25*unit('degC'),pressure=1*unit('atm')):
     pressure    : Quantity, optional
                   The ambient pressure of the solution. 
                   Defaults to atmospheric pressure (1 atm) if omitted.
+    quantity    : bool, optional
+                  If False, return the result in SI units as a plain float
+                  instead of a Quantity, without any logging. This avoids the
+                  overhead of pint in inner loops. Defaults to True.
                   
     Returns
     -------
-    Quantity
+    Quantity or float
             The specific weight of water in N/m3.  
     
     Examples
@@ -105,11 +387,17 @@ def water_specific_weight(temperature=25*unit('degC'),pressure=1*unit('atm')):
     water_density
     
     '''
-    spweight = water_density(temperature,pressure) * unit.g_n
-    logger.info('Computed specific weight of water as %s at T=%s and P = %s' % (spweight,temperature,pressure))
-    return spweight.to('N/m ** 3')
+    gamma = _water_density_magnitude(temperature) * _STANDARD_GRAVITY
+    if not quantity:
+        return gamma
+    
+    spweight = unit.Quantity(gamma,'N/m ** 3')
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Computed specific weight of water as %s at T=%s and P = %s', spweight,temperature,pressure)
+    return spweight
 
-def water_viscosity_dynamic(temperature=25*unit('degC'),pressure=1*unit('atm')):
+@_last_value_cache
+def water_viscosity_dynamic(temperature=_DEFAULT_TEMPERATURE,pressure=_DEFAULT_PRESSURE,quantity=True):
     '''
     Return the dynamic (absolute) viscosity of water in N-s/m2 = Pa-s = kg/m-s
     at the specified temperature.
@@ -121,10 +409,14 @@ def water_viscosity_dynamic(temperature=25*unit('degC'),pressure=1*unit('atm')):
     pressure    : Quantity, optional
                   The ambient pressure of the solution. 
                   Defaults to atmospheric pressure (1 atm) if omitted.
+    quantity    : bool, optional
+                  If False, return the result in SI units as a plain float
+                  instead of a Quantity, without any logging. This avoids the
+                  overhead of pint in inner loops. Defaults to True.
     
     Returns
     -------
-    Quantity 
+    Quantity or float
                 The dynamic (absolute) viscosity of water in N-s/m2 = Pa-s = kg/m-s
                   
     Notes
@@ -141,63 +433,39 @@ def water_viscosity_dynamic(temperature=25*unit('degC'),pressure=1*unit('atm')):
     Examples
     --------
     >>> water_viscosity_dynamic(20*unit('degC')) #doctest: +ELLIPSIS
-    <Quantity(0.000998588610804179, 'kilogram / meter / second')>
+    <Quantity(0.00099858861080..., 'kilogram / meter / second')>
     >>> water_viscosity_dynamic(unit('100 degC'),unit('25 MPa')) #doctest: +ELLIPSIS
-    <Quantity(0.00028165034364318573, 'kilogram / meter / second')>
+    <Quantity(0.00028165034364..., 'kilogram / meter / second')>
     >>> water_viscosity_dynamic(25*unit('degC'),0.1*unit('MPa')) #doctest: +ELLIPSIS
-    <Quantity(0.0008872817880143659, 'kilogram / meter / second')>
+    <Quantity(0.00088728178801..., 'kilogram / meter / second')>
     
     #TODO - check these again after I implement pressure-dependent density function
     
     '''
+    T_K = temperature.to('K').magnitude
+    P_Pa = pressure.to('Pa').magnitude
+    
     # generate warnings if temp or pressure are outside valid range of equation
-    if temperature < 273 * unit('K') or temperature > 1073 * unit('K'):
-        logger.error('Specified temperature (%s) exceeds valid range of NIST equation for viscosity of water. Cannot extrapolate.' % temperature)
-        return None
-        
-    if pressure < 0 * unit('Pa') or pressure > 100000000 * unit ('Pa'):
-        logger.error('Specified pressure (%s) exceeds valid range of NIST equation for viscosity of water. Cannot extrapolate.' % pressure)
+    if not _check_viscosity_range(T_K,P_Pa,temperature,pressure):
         return None
     
-    # calculate dimensionless temperature and pressure
-    T_star = 647.27 #K
-    P_star = 22115000 #Pa
-    rho_star = 317.763 #kg/m3
-    
-    T_bar = temperature.to('K').magnitude / T_star
-    P_bar = pressure.to('Pa').magnitude / P_star
-    rho_bar = water_density(temperature,pressure).magnitude / rho_star
+    # the numerical work happens in a pure-float kernel, which numba can compile
+    mu = _water_state(temperature.to('degC').magnitude,T_K)[1]
+    if not quantity:
+        return mu
     
-    # calculate the first function, mu_o
-    mu_star = 1e-6 #Pa-s
-    a = [0.0181583,0.0177624,0.0105287,-0.0036477]
-    sum_o = 0
-    mu_temp = 0
-    for index in range(len(a)):
-        sum_o += a[index] * T_bar ** -index
+    viscosity = unit.Quantity(mu,'kg/m/s')
     
-    mu_o = mu_star * math.sqrt(T_bar) / sum_o
-    
-    # calculate the second fucntion, mu_1
-    b=[[0.501938,0.235622,-0.274637,0.145831,-0.0270448],[0.162888,0.789393,-0.743539,0.263129,-0.0253093],[-0.130356,0.673665,-0.959456,0.347247,-0.0267758],[0.907919,1.207552,-0.687343,0.213486,-0.0822904],[-0.551119,0.0670665,-0.497089,0.100754,0.0602253],[0.146543,-0.0843370,0.195286,-0.032932,-0.0202595]]
-    mu_1 = 0
-    
-    for i in range(len(b)):
-        for j in range(len(b[i])):
-            mu_temp += rho_bar * b[i][j] * (1/T_bar -1 ) ** i * (rho_bar -1) ** j
-    
-    mu_1 = math.exp(mu_temp)
-    # multiply the functions to return the viscosity
-    viscosity = mu_o * mu_1 *unit('kg/m/s')
-    
-    logger.info('Computed dynamic (absolute) viscosity of water as %s at T=%s and P = %s'  % (viscosity,temperature,pressure)) 
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Computed dynamic (absolute) viscosity of water as %s at T=%s and P = %s', viscosity,temperature,pressure)
     
     logger.debug('Computed dynamic (absolute) viscosity of water using empirical NIST equation described in Sengers, J.V. "Representative Equations for the Viscosity of Water Substance." J. Phys. Chem. Ref. Data 13(1), 1984.')
     
-    return viscosity.to('kg/m/s')
+    return viscosity
 
 
-def water_viscosity_kinematic(temperature=25*unit('degC'),pressure=1*unit('atm')):
+@_last_value_cache
+def water_viscosity_kinematic(temperature=_DEFAULT_TEMPERATURE,pressure=_DEFAULT_PRESSURE,quantity=True):
     '''
     Return the kinematic viscosity of water in m2/s = Stokes
     at the specified temperature.
@@ -209,16 +477,20 @@ def water_viscosity_kinematic(temperature=25*unit('degC'),pressure=1*unit('atm')
     pressure    : Quantity, optional
                   The ambient pressure of the solution. 
                   Defaults to atmospheric pressure (1 atm) if omitted.
+    quantity    : bool, optional
+                  If False, return the result in SI units as a plain float
+                  instead of a Quantity, without any logging. This avoids the
+                  overhead of pint in inner loops. Defaults to True.
                   
     Returns
     -------
-    Quantity
+    Quantity or float
             The kinematic viscosity of water in Stokes (m2/s)
     
     Examples
     --------
     >>> water_viscosity_kinematic()  #doctest: +ELLIPSIS
-    <Quantity(8.899146003595295e-07, 'meter ** 2 / second')>
+    <Quantity(8.8991460035...e-07, 'meter ** 2 / second')>
             
     See Also
     --------
@@ -226,23 +498,37 @@ def water_viscosity_kinematic(temperature=25*unit('degC'),pressure=1*unit('atm')
     water_density
     
     '''
-    kviscosity = water_viscosity_dynamic(temperature,pressure) / water_density(temperature,pressure)
-    logger.info('Computed kinematic viscosity of water as %s at T=%s and P = %s ' % (kviscosity,temperature,pressure)) 
-    return kviscosity.to('m**2 / s')
+    T_K = temperature.to('K').magnitude
+    P_Pa = pressure.to('Pa').magnitude
+    
+    if not _check_viscosity_range(T_K,P_Pa,temperature,pressure):
+        return None
+    
+    # the density and viscosity come from a single (cached) evaluation
+    rho, mu = _water_state(temperature.to('degC').magnitude,T_K)
+    if not quantity:
+        return mu / rho
+    
+    kviscosity = unit.Quantity(mu / rho,'m**2 / s')
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Computed kinematic viscosity of water as %s at T=%s and P = %s ', kviscosity,temperature,pressure)
+    return kviscosity
     
 
-def water_dielectric_constant(temperature=25*unit('degC')):
+@_last_value_cache
+def water_dielectric_constant(temperature=_DEFAULT_TEMPERATURE):
     '''    
     Return the dielectric constant of water at the specified temperature.
     
     Parameters
     ----------
     temperature : Quantity, optional
-                  The temperature. Defaults to 25 degC if omitted.
+                  The temperature. Defaults to 25 degC if omitted. The magnitude
+                  may be an array, in which case an array is returned.
                   
     Returns
     -------
-    float
+    float or array
             The dielectric constant (or permittivity) of water relative to the
             permittivity of a vacuum. Dimensionless.
     
@@ -264,6 +550,8 @@ def water_dielectric_constant(temperature=25*unit('degC')):
     --------
     >>> water_dielectric_constant(unit('20 degC')) #doctest: +ELLIPSIS
     80.15060...
+    >>> water_dielectric_constant(np.array([20,25])*unit('degC')) #doctest: +ELLIPSIS
+    array([80.15060182, 78.35530812])
     
     Display an error if 'temperature' is outside the valid range
     
@@ -271,24 +559,267 @@ def water_dielectric_constant(temperature=25*unit('degC')):
     
      
     '''
+    T_K = temperature.to('K').magnitude
+    scalar = np.ndim(T_K) == 0
+    
     # do not return anything if 'temperature' is outside the range for which
-    # this fit applies
-    if temperature < 273 * unit('K') or temperature > 372 * unit('K'):
-        logger.error('Specified temperature (%s) exceeds valid range of data. Cannot extrapolate.' % temperature.to('K'))
+    # this fit applies. Single temperatures are compared directly, which is
+    # much faster than np.any()
+    if scalar:
+        out_of_range = T_K < _DIELECTRIC_T_MIN or T_K > _DIELECTRIC_T_MAX
+    else:
+        out_of_range = np.any(T_K < _DIELECTRIC_T_MIN) or np.any(T_K > _DIELECTRIC_T_MAX)
+    
+    if out_of_range:
+        logger.error('Specified temperature (%s) exceeds valid range of data. Cannot extrapolate.', unit.Quantity(T_K,'kelvin'))
         return None
     
-    # otherwise, calculate the dielectric constant using the quadratic fit    
-    a = 0.24921e3
-    b = -0.79069e0
-    c = 0.72997e-3
-    dielectric = a + b * temperature.to('K').magnitude + c * temperature.to('K').magnitude ** 2
+    # otherwise, calculate the dielectric constant using the quadratic fit.
+    # Arrays of temperatures can't be memoized, so evaluate them directly
+    if scalar:
+        dielectric = _water_dielectric_constant_cached(T_K)
+    else:
+        dielectric = _water_dielectric_constant(T_K)
     
-    logger.info('Computed dielectric constant of water as %s at %s' % (dielectric,temperature))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Computed dielectric constant of water as %s at %s', dielectric,temperature)
     
     logger.debug('Computed dielectric constant of water using empirical equation given in "Permittivity (Dielectric Constant) of Liquids." CRC Handbook of Chemistry and Physics, 92nd ed, pp 6-187 - 6-208.')
     
     return dielectric
     
+@_last_value_cache
+def water_properties(temperature=_DEFAULT_TEMPERATURE,pressure=_DEFAULT_PRESSURE,quantity=True):
+    '''
+    Return the density, dynamic viscosity, and dielectric constant of water
+    at the specified temperature and pressure.
+    
+    This is equivalent to calling water_density(), water_viscosity_dynamic(),
+    and water_dielectric_constant() separately, but converts the temperature
+    only once and reuses the computed density in the viscosity calculation.
+    
+    Parameters
+    ----------
+    temperature : Quantity, optional
+                  The temperature. Defaults to 25 degC if omitted.
+    pressure    : Quantity, optional
+                  The ambient pressure of the solution. 
+                  Defaults to atmospheric pressure (1 atm) if omitted.
+    quantity    : bool, optional
+                  If False, return the density and viscosity in SI units as
+                  plain floats instead of Quantities. Defaults to True.
+    
+    Returns
+    -------
+    tuple
+            The density of water in kg/m3, the dynamic viscosity in kg/m-s, and
+            the (dimensionless) dielectric constant. The viscosity or dielectric
+            constant is None if the temperature or pressure is outside the valid
+            range of the respective equation.
+    
+    Examples
+    --------
+    >>> water_properties(25*unit('degC')) #doctest: +ELLIPSIS
+    (<Quantity(997.0415, 'kilogram / meter ** 3')>, <Quantity(0.00088728178801..., 'kilogram / meter / second')>, 78.35530...)
+    
+    See Also
+    --------
+    water_density
+    water_viscosity_dynamic
+    water_dielectric_constant
+    
+    '''
+    T_K = temperature.to('K').magnitude
+    P_Pa = pressure.to('Pa').magnitude
+    
+    T_C = temperature.to('degC').magnitude
+    
+    if _check_viscosity_range(T_K,P_Pa,temperature,pressure):
+        rho, mu = _water_state(T_C,T_K)
+    else:
+        rho, mu = _water_density_cached(T_C), None
+    
+    if T_K < _DIELECTRIC_T_MIN or T_K > _DIELECTRIC_T_MAX:
+        logger.error('Specified temperature (%s) exceeds valid range of data. Cannot extrapolate.', unit.Quantity(T_K,'kelvin'))
+        dielectric = None
+    else:
+        dielectric = _water_dielectric_constant_cached(T_K)
+    
+    if not quantity:
+        return rho, mu, dielectric
+    
+    density = unit.Quantity(rho,'kg/m**3')
+    viscosity = None if mu is None else unit.Quantity(mu,'kg/m/s')
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Computed density, viscosity, and dielectric constant of water as %s, %s, and %s at T=%s and P = %s', density,viscosity,dielectric,temperature,pressure)
+    return density, viscosity, dielectric
+
+def get_backend():
+    '''
+    Return the name of the backend that evaluates the numerical kernels in this
+    module.
+    
+    Returns
+    -------
+    str
+            'numba' if numba is installed and the kernels are compiled to native
+            code, or 'python' if they run as ordinary Python and numpy code.
+    
+    Examples
+    --------
+    >>> get_backend() in ('numba','python')
+    True
+    
+    '''
+    if HAS_NUMBA:
+        return 'numba'
+    else:
+        return 'python'
+
+def water_density_array(T_K,P_Pa=101325):
+    '''
+    Return the density of water at each of an array of temperatures.
+    
+    This is a vectorized counterpart of water_density() for bulk calculations.
+    It works on plain numbers in SI units rather than Quantity objects.
+    
+    Parameters
+    ----------
+    T_K : array_like
+          The temperatures in Kelvin.
+    P_Pa : array_like, optional
+          The pressures in Pascals. Defaults to atmospheric pressure. Must
+          broadcast against T_K. The density correlation does not depend on
+          pressure; this argument is accepted for consistency with the other
+          array functions, and determines the shape of the result.
+    
+    Returns
+    -------
+    numpy.ndarray
+            The density of water in kg/m3 at each state.
+    
+    Examples
+    --------
+    >>> water_density_array([293.15,298.15]) #doctest: +ELLIPSIS
+    array([998.21504875, 997.0415    ])
+    
+    See Also
+    --------
+    water_density
+    
+    '''
+    T_K, P_Pa = np.broadcast_arrays(np.asarray(T_K,dtype=float),np.asarray(P_Pa,dtype=float))
+    return _water_density(T_K - 273.15)
+
+def water_viscosity_dynamic_array(T_K,P_Pa=101325):
+    '''
+    Return the dynamic (absolute) viscosity of water at each of an array of
+    temperatures and pressures.
+    
+    This is a vectorized counterpart of water_viscosity_dynamic() for bulk
+    calculations. It works on plain numbers in SI units rather than Quantity
+    objects.
+    
+    Parameters
+    ----------
+    T_K : array_like
+          The temperatures in Kelvin.
+    P_Pa : array_like, optional
+          The pressures in Pascals. Defaults to atmospheric pressure. Must
+          broadcast against T_K.
+    
+    Returns
+    -------
+    numpy.ndarray
+            The dynamic viscosity of water in kg/m-s at each state. Elements
+            outside the valid range of the NIST equation are NaN.
+    
+    Examples
+    --------
+    >>> water_viscosity_dynamic_array([293.15,298.15]) #doctest: +ELLIPSIS
+    array([0.00099859, 0.00088728])
+    
+    Evaluate a grid of temperatures (rows) and pressures (columns) by broadcasting
+    
+    >>> T = np.array([293.15,323.15,353.15])
+    >>> P = np.array([1e5,1e7])
+    >>> water_viscosity_dynamic_array(T[:,np.newaxis],P).shape
+    (3, 2)
+    
+    See Also
+    --------
+    water_viscosity_dynamic
+    
+    '''
+    T_K, P_Pa = np.broadcast_arrays(np.asarray(T_K,dtype=float),np.asarray(P_Pa,dtype=float))
+    
+    valid = (T_K >= _VISC_T_MIN) & (T_K <= _VISC_T_MAX) & (P_Pa >= _VISC_P_MIN) & (P_Pa <= _VISC_P_MAX)
+    if not np.all(valid):
+        logger.error('Specified temperature or pressure exceeds valid range of NIST equation for viscosity of water. Returning NaN for %s states.', np.count_nonzero(~valid))
+    
+    # the invalid states are masked below, so ignore any floating point errors
+    # they produce
+    with np.errstate(all='ignore'):
+        rho = _water_density(T_K - 273.15)
+        
+        # with numba, run the compiled scalar kernel over the states in parallel.
+        # Otherwise, evaluate the same polynomials for all the states at once
+        # with numpy
+        if HAS_NUMBA:
+            # substitute 25 degC for the invalid states, so that the kernel
+            # does not evaluate them
+            T_valid = np.where(valid,T_K,298.15)
+            rho_valid = np.where(valid,rho,_water_density(25.0))
+            viscosity = _water_viscosity_dynamic_batch(T_valid.ravel(),rho_valid.ravel()).reshape(T_K.shape)
+        else:
+            # dimensionless temperature and density
+            T_bar = T_K / _VISC_T_STAR
+            rho_bar = rho / _VISC_RHO_STAR
+            
+            inv_T = 1 / T_bar
+            mu_o = _VISC_MU_STAR * np.sqrt(T_bar) / poly.polyval(inv_T,_VISC_A)
+            mu_1 = np.exp(rho_bar * poly.polyval2d(inv_T - 1,rho_bar - 1,_VISC_B))
+            viscosity = mu_o * mu_1
+    
+    return np.where(valid,viscosity,np.nan)
+
+def water_dielectric_constant_array(T_K):
+    '''
+    Return the dielectric constant of water at each of an array of temperatures.
+    
+    This is a vectorized counterpart of water_dielectric_constant() for bulk
+    calculations. It works on plain numbers rather than Quantity objects.
+    
+    Parameters
+    ----------
+    T_K : array_like
+          The temperatures in Kelvin.
+    
+    Returns
+    -------
+    numpy.ndarray
+            The (dimensionless) dielectric constant of water at each temperature.
+            Elements outside the valid range of the fit (273 - 372 K) are NaN.
+    
+    Examples
+    --------
+    >>> water_dielectric_constant_array([293.15,298.15]) #doctest: +ELLIPSIS
+    array([80.15060182, 78.35530812])
+    
+    See Also
+    --------
+    water_dielectric_constant
+    
+    '''
+    T_K = np.asarray(T_K,dtype=float)
+    
+    valid = (T_K >= _DIELECTRIC_T_MIN) & (T_K <= _DIELECTRIC_T_MAX)
+    if not np.all(valid):
+        logger.error('Specified temperature exceeds valid range of data. Returning NaN for %s temperatures.', np.count_nonzero(~valid))
+    
+    return np.where(valid,_water_dielectric_constant(T_K),np.nan)
+
 def water_conductivity(temperature):
     pass
 